@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import threading
 from collections import deque
-from typing import TYPE_CHECKING, Any, Callable, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Generator, Optional, cast
 
 import tkinter as tk
 
@@ -74,6 +75,18 @@ class FileHandler:
             groups["Other"].extend(sorted(other_extensions))
         return groups
 
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def get_sorted_extension_groups(cls) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """Extension groups with each group's extensions sorted, as immutable tuples.
+
+        The groups are static, so the result is computed once and shared.
+        """
+        return tuple(
+            (group, tuple(sorted(extensions)))
+            for group, extensions in cls.get_extension_groups().items()
+        )
+
     def apply_filter(self, query: str) -> None:
         """
         Filters the file tree based on the query.
@@ -90,6 +103,7 @@ class FileHandler:
 
         tree = gui.structure_tab.tree
         tree.delete(*tree.get_children())
+        gui.structure_tab.forget_items()
 
         query_lower = query.lower()
         matches: list[str] = []
@@ -148,6 +162,7 @@ class FileHandler:
         tree = gui.structure_tab.tree
         logging.info(f"Populating tree for root: {root_dir}")
         tree.delete(*tree.get_children())
+        gui.structure_tab.forget_items()
 
         if hasattr(self, '_expanding_items'):
             self._expanding_items.clear()
@@ -166,24 +181,30 @@ class FileHandler:
         gui = cast("RepoPromptGUI", self.gui)
         tree = gui.structure_tab.tree
         logging.info(f"Building level for path: {path}, parent: {parent_id}, selected: {selected}")
-        for child in tree.get_children(parent_id):
-            tree.delete(child)
+        stale_children = tree.get_children(parent_id)
+        if stale_children:
+            gui.structure_tab.forget_items(stale_children)
+            tree.delete(*stale_children)
 
         try:
             items = sorted(os.listdir(path))
-            logging.debug(f"Found items: {items}")
+            logging.debug("Found items: %s", items)
         except OSError as e:
             logging.error(f"Dir list error: {path} - {e}")
             tree.insert(parent_id, "end", text=f"Error: {e.strerror}", tags=('error',))
             return
 
         added_items = 0
+        insert = tree.insert
+        # Selection bookkeeping is applied under one lock acquisition after the loop
+        newly_loaded: list[str] = []
+        newly_unloaded: list[str] = []
         for item in items:
             item_path = os.path.join(path, item)
             item_path_norm = normalize_path(item_path)
 
             if is_ignored_path(item_path, self.repo_path, self.ignore_patterns, self.gui):
-                logging.debug(f"Ignored: {item_path}")
+                logging.debug("Ignored: %s", item_path)
                 continue
 
             is_dir = os.path.isdir(item_path)
@@ -191,7 +212,7 @@ class FileHandler:
             if not is_dir:
                 is_text = is_text_file(item_path, self.gui)
 
-            logging.debug(f"Processing item: {item}, dir: {is_dir}, text: {is_text}")
+            logging.debug("Processing item: %s, dir: %s, text: %s", item, is_dir, is_text)
 
             icon = "📁" if is_dir else ("📄" if is_text else "❓")
             checkbox_state = "☑" if selected else "☐"
@@ -202,26 +223,29 @@ class FileHandler:
             elif is_text:
                 if selected:
                     tags.append('file_selected')
-                    with self.lock:
-                        self.loaded_files.add(item_path_norm)
+                    newly_loaded.append(item_path_norm)
                 else:
                     tags.append('file_default')
-                    with self.lock:
-                        self.loaded_files.discard(item_path_norm)
+                    newly_unloaded.append(item_path_norm)
             else:
                 tags.append('file_nontext')
 
             try:
-                item_id = tree.insert(parent_id, "end", text=f"{icon} {item}",
-                                              values=(item_path, checkbox_state),
-                                              open=False, tags=tuple(tags))
-                logging.debug(f"Inserted item ID: {item_id}, tags: {tags}")
+                item_id = insert(parent_id, "end", text=f"{icon} {item}",
+                                 values=(item_path, checkbox_state),
+                                 open=False, tags=tuple(tags))
+                logging.debug("Inserted item ID: %s, tags: %s", item_id, tags)
                 if is_dir:
-                    tree.insert(item_id, "end", text="Loading...", tags=('dummy',))
+                    insert(item_id, "end", text="Loading...", tags=('dummy',))
                 added_items += 1
             except Exception as e:
                 logging.error(f"Error inserting item {item} into tree: {e}")
 
+        if newly_loaded or newly_unloaded:
+            with self.lock:
+                self.loaded_files.update(newly_loaded)
+                self.loaded_files.difference_update(newly_unloaded)
+
         if added_items == 0 and not tree.get_children(parent_id):
              logging.debug(f"No items added to {path}")
              tree.insert(parent_id, "end", text="(empty)", tags=('empty',))
@@ -251,6 +275,7 @@ class FileHandler:
                 values = tree.item(item_id)['values']
                 if not values or len(values) < 2:
                     logging.error(f"Cannot expand folder: Item {item_id} has invalid values '{values}'")
+                    gui.structure_tab.forget_items(children)
                     for child in children:
                         tree.delete(child)
                     tree.insert(item_id, "end", text="Error: Invalid data", tags=('error',))
@@ -261,7 +286,9 @@ class FileHandler:
                 parent_selected = values[1] == "☑"
 
                 self.build_tree_level(item_path, item_id, parent_selected)
-                logging.debug(f"Finished building level for {item_id}. It now has {len(tree.get_children(item_id))} children.")
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    # The child count costs a Tcl call, so only compute it when it will be logged
+                    logging.debug("Finished building level for %s. It now has %d children.", item_id, len(tree.get_children(item_id)))
             else:
                 logging.debug(f"Item '{item_id}' is either empty or already populated. No action needed.")
 
@@ -317,7 +344,11 @@ class FileHandler:
 
         logging.debug(f"New state: {new_state_symbol}, tags: {new_tags}")
 
-        gui.structure_tab.update_tree_strikethrough()
+        if 'folder' in tags:
+            gui.structure_tab.update_tree_strikethrough()
+        else:
+            # Only this row changed; avoid sweeping every file in the tree
+            gui.structure_tab.update_item_strikethrough(item_id)
 
         if content_changed:
              gui.trigger_preview_update()
@@ -393,7 +424,7 @@ class FileHandler:
         content_changed_flag = False
         children = tree.get_children(item_id)
 
-        logging.debug(f"Recursive update for {item_id}, selected: {selected}")
+        logging.debug("Recursive update for %s, selected: %s", item_id, selected)
 
         if children and tuple(tree.item(children[0])['tags']) == ('dummy',):
              self.expand_folder(item_id)
@@ -410,7 +441,7 @@ class FileHandler:
             tags = list(child_data['tags'])
             new_state_symbol = "☑" if selected else "☐"
 
-            logging.debug(f"Updating child: {child_id}, new_state: {new_state_symbol}")
+            logging.debug("Updating child: %s, new_state: %s", child_id, new_state_symbol)
 
             if 'folder' in tags:
                 tree.item(child_id, values=(child_path, new_state_symbol))
@@ -501,6 +532,19 @@ class FileHandler:
         gui = cast("RepoPromptGUI", self.gui)
         tree = gui.structure_tab.tree
 
+        for processed_count in self.iter_expand_all(item, max_depth):
+            if processed_count % TREE_UI_UPDATE_INTERVAL == 0:
+                tree.update_idletasks()
+
+    def iter_expand_all(self, item: str = "", max_depth: Optional[int] = None) -> Generator[int, None, None]:
+        """Breadth-first expand walk that yields the processed-item count after each item.
+
+        expand_all drains it in one go; StructureTab advances it in time-sliced
+        chunks so "Expand All" never blocks the UI for long.
+        """
+        gui = cast("RepoPromptGUI", self.gui)
+        tree = gui.structure_tab.tree
+
         if max_depth is None:
             max_depth = self._calculate_smart_depth_limit()
 
@@ -514,13 +558,17 @@ class FileHandler:
             processed_count += 1
 
             if depth >= max_depth:
-                logging.debug(f"Skipping expansion at depth {depth} (max: {max_depth})")
+                logging.debug("Skipping expansion at depth %s (max: %s)", depth, max_depth)
                 continue
 
             if processed_count > 1000 and depth > 5:
                 logging.warning(f"Stopping expansion at depth {depth} due to high item count ({processed_count})")
                 break
 
+            # The walk may be resumed across event-loop turns; rows can vanish meanwhile
+            if current_item and not tree.exists(current_item):
+                continue
+
             children = tree.get_children(current_item)
 
             for child_id in children:
@@ -531,8 +579,7 @@ class FileHandler:
                         tree.item(child_id, open=True)
                         items_to_process.append((child_id, depth + 1))
 
-            if processed_count % TREE_UI_UPDATE_INTERVAL == 0:
-                tree.update_idletasks()
+            yield processed_count
 
         if processed_count >= TREE_SAFETY_LIMIT:
             logging.warning(f"expand_all: Processed {processed_count} items, stopped at safety limit")
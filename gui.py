@@ -896,11 +896,12 @@ class RepoPromptGUI:
             self.show_status_message("All data cleared.")
 
     def save_app_settings(self) -> None:
+        self.settings_tab.ensure_ui()
         try:
-            self.settings.set('app', 'default_tab', self.settings_tab.default_tab_var.get())
+            self.settings.set('app', 'default_tab', self.settings_tab.default_tab_menu.get())
             self.settings.set('app', 'prepend_prompt', self.prepend_var.get())
             self.settings.set('app', 'show_unloaded', self.show_unloaded_var.get())
-            self.settings.set('app', 'expansion', self.settings_tab.expansion_var.get())
+            self.settings.set('app', 'expansion', self.settings_tab.expansion_menu.get())
             levels = self.settings_tab.levels_entry.get()
             if levels.isdigit():
                  self.settings.set('app', 'levels', int(levels))
@@ -911,30 +912,31 @@ class RepoPromptGUI:
             self.settings.set('app', 'exclude_dist', self.settings_tab.exclude_dist_var.get())
             self.settings.set('app', 'exclude_coverage', self.settings_tab.exclude_coverage_var.get())
             self.settings.set('app', 'exclude_lock_files', self.settings_tab.exclude_lock_files_var.get())
-            self.settings.set('app', 'exclude_files', {file: var.get() for file, var in self.settings_tab.exclude_file_vars.items()})
+            self.settings.set('app', 'exclude_files', self.settings_tab.get_exclude_selection())
             self.settings.set('app', 'search_case_sensitive', self.case_sensitive_var.get())
             self.settings.set('app', 'search_whole_word', self.whole_word_var.get())
             self.settings.set('app', 'include_icons', self.settings_tab.include_icons_var.get())
+            self.settings.set('app', 'settings_tooltips', self.settings_tab.settings_tooltips_var.get())
             self.settings.set('app', 'high_contrast', self.high_contrast_mode.get())
-            ext_settings = {ext: var.get() for ext, (cb, var, *_) in self.settings_tab.extension_checkboxes.items()}
+            ext_settings = self.settings_tab.get_extension_selection()
             self.settings.set('app', 'text_extensions', ext_settings)
             
             # Save new configurable settings
             # Performance settings
             try:
-                cache_max_size = int(self.settings_tab.cache_max_size_var.get())
+                cache_max_size = int(self.settings_tab.cache_max_size_entry.get())
                 self.settings.set('app', 'cache_max_size', cache_max_size)
             except ValueError:
                 pass
             
             try:
-                cache_max_memory = int(self.settings_tab.cache_max_memory_var.get())
+                cache_max_memory = int(self.settings_tab.cache_max_memory_entry.get())
                 self.settings.set('app', 'cache_max_memory_mb', cache_max_memory)
             except ValueError:
                 pass
             
             try:
-                tree_max_items = int(self.settings_tab.tree_max_items_var.get())
+                tree_max_items = int(self.settings_tab.tree_max_items_entry.get())
                 self.settings.set('app', 'tree_max_items', tree_max_items)
             except ValueError:
                 pass
@@ -942,13 +944,13 @@ class RepoPromptGUI:
             # Security settings
             self.settings.set('app', 'security_enabled', self.settings_tab.security_enabled_var.get())
             try:
-                max_file_size = int(self.settings_tab.max_file_size_var.get())
+                max_file_size = int(self.settings_tab.max_file_size_entry.get())
                 self.settings.set('app', 'max_file_size_mb', max_file_size)
             except ValueError:
                 pass
             
             # Logging settings
-            self.settings.set('app', 'log_level', self.settings_tab.log_level_var.get())
+            self.settings.set('app', 'log_level', self.settings_tab.log_level_menu.get())
             self.settings.set('app', 'log_to_file', self.settings_tab.log_to_file_var.get())
             self.settings.set('app', 'log_to_console', self.settings_tab.log_to_console_var.get())
             
@@ -20,13 +20,13 @@ class SearchHandler:
         current_index = self.gui.notebook.index(self.gui.notebook.select())  # type: ignore[no-untyped-call]
         if current_index == 2:
             return
-        if current_index == 4:
+        tab_instances = [self.gui.content_tab, self.gui.structure_tab, self.gui.module_analysis_tab, self.gui.base_prompt_tab, self.gui.settings_tab, self.gui.file_list_tab]
+        tab = tab_instances[current_index]
+        if not getattr(tab, 'SEARCHABLE', True):
             return
 
         self._clear_search_highlights(current_index)
 
-        tab_instances = [self.gui.content_tab, self.gui.structure_tab, self.gui.module_analysis_tab, self.gui.base_prompt_tab, self.gui.settings_tab, self.gui.file_list_tab]
-        tab = tab_instances[current_index]
         matches = tab.perform_search(query, self.gui.case_sensitive_var.get(), self.gui.whole_word_var.get())
 
         self.gui.match_positions[current_index] = matches
@@ -84,13 +84,13 @@ class SearchHandler:
         current_index = self.gui.notebook.index(self.gui.notebook.select())  # type: ignore[no-untyped-call]
         if current_index == 2:
             return
-        if current_index == 4:
+        tab_instances = [self.gui.content_tab, self.gui.structure_tab, self.gui.module_analysis_tab, self.gui.base_prompt_tab, self.gui.settings_tab, self.gui.file_list_tab]
+        tab = cast(Any, tab_instances[current_index])
+        if not getattr(tab, 'SEARCHABLE', True):
             return
 
         self._clear_search_highlights(current_index)
 
-        tab_instances = [self.gui.content_tab, self.gui.structure_tab, self.gui.module_analysis_tab, self.gui.base_prompt_tab, self.gui.settings_tab, self.gui.file_list_tab]
-        tab = cast(Any, tab_instances[current_index])
         matches = tab.perform_search(query, self.gui.case_sensitive_var.get(), self.gui.whole_word_var.get())
 
         tab.highlight_all_matches(matches)
@@ -6,7 +6,7 @@ from __future__ import annotations
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 try:
     import networkx as nx  # type: ignore[import-untyped]
@@ -28,6 +28,12 @@ MAX_READ_BYTES = 50 * 1024
 # Maximum nodes beyond which we skip graph layout (use text fallback in UI)
 MAX_GRAPH_NODES = 100
 
+# Report graph-build progress every N files scanned for imports
+PROGRESS_INTERVAL = 100
+
+# progress_callback(files_done, files_total); called from the analysis (worker) thread
+AnalysisProgressCallback = Callable[[int, int], None]
+
 # Default max distance for disconnected components (overridden by constants.CLUSTER_DISCONNECTED_DISTANCE when used)
 _DEFAULT_DISCONNECTED_DISTANCE = 1000.0
 
@@ -237,10 +243,12 @@ def build_dependency_graph(
     repo_root: str,
     module_to_files: Dict[str, List[Tuple[str, str]]],
     all_files: Dict[str, str],
+    progress_callback: Optional[AnalysisProgressCallback] = None,
 ) -> Tuple[Any, Dict[str, float]]:
     """
     Build networkx DiGraph: nodes = module names, edge A->B if any file in A imports from B.
     Impact = in_degree_centrality (how many modules depend on this one).
+    progress_callback(done, total) is invoked every PROGRESS_INTERVAL files and once at the end.
     """
     if nx is None:
         return None, {}
@@ -248,6 +256,8 @@ def build_dependency_graph(
     module_names = set(module_to_files.keys())
     for mod in module_names:
         G.add_node(mod)
+    total_files = sum(len(file_list) for file_list in module_to_files.values())
+    done = 0
     for mod_name, file_list in module_to_files.items():
         for rel_path, abs_path in file_list:
             imports = _get_imports_from_source(abs_path)
@@ -256,6 +266,11 @@ def build_dependency_graph(
                 target = _resolve_ref_to_module(ref_key, rel_path, module_names)
                 if target and target != mod_name:
                     G.add_edge(mod_name, target)
+            done += 1
+            if progress_callback is not None and done % PROGRESS_INTERVAL == 0:
+                progress_callback(done, total_files)
+    if progress_callback is not None and done % PROGRESS_INTERVAL != 0:
+        progress_callback(done, total_files)
     if G.number_of_nodes() == 0:
         return G, {}
     try:
@@ -440,6 +455,7 @@ def get_recommendations(
 def modules_with_impact(
     repo_root: str,
     enabled_extensions: Optional[Set[str]] = None,
+    progress_callback: Optional[AnalysisProgressCallback] = None,
 ) -> Tuple[
     List[Tuple[str, int, float]],
     Any,
@@ -458,6 +474,7 @@ def modules_with_impact(
       - module_display_name -> list of absolute paths (for selection bridge)
       - list of (cluster_name, module_keys, file_count, aggregate_impact) for clusters
       - linkage matrix Z (for dendrogram) or None
+    progress_callback(done, total) reports files scanned for imports (see build_dependency_graph).
     """
     try:
         from constants import (
@@ -475,7 +492,9 @@ def modules_with_impact(
     module_to_files, all_files = discover_modules(repo_root, enabled_extensions)
     if not module_to_files:
         return [], None, {}, {}, [], None
-    G, centrality = build_dependency_graph(repo_root, module_to_files, all_files)
+    G, centrality = build_dependency_graph(
+        repo_root, module_to_files, all_files, progress_callback=progress_callback
+    )
     result: List[Tuple[str, int, float]] = []
     module_to_abs_paths: Dict[str, List[str]] = {}
     for mod_name, files in module_to_files.items():
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import os
-from typing import Any, Optional, cast
+from typing import Any, Mapping, Optional, cast
 
 import appdirs  # type: ignore[import-untyped]
 
@@ -58,6 +58,7 @@ class SettingsManager:
                     'Gemfile.lock': 1, 'poetry.lock': 1, 'get-pip.py': 1
                 },
                 "include_icons": 1,
+                "settings_tooltips": 1,
                 "high_contrast": 0,
                 "search_case_sensitive": 0,
                 "search_whole_word": 0,
@@ -150,6 +151,18 @@ class SettingsManager:
         # Use the loaded self.settings which includes defaults
         return self.settings.get(section, {}).get(key, default)
 
+    def get_section(self, section: str) -> Mapping[str, Any]:
+        """Gets a whole section (defaults already merged) for bulk reads; do not mutate it."""
+        return cast(Mapping[str, Any], self.settings.get(section, {}))
+
+    def get_many(self, section: str, defaults: dict[str, Any]) -> dict[str, Any]:
+        """Gets several settings from one section at once.
+
+        defaults maps each wanted key to the value used when it is missing.
+        """
+        values = self.settings.get(section, {})
+        return {key: values.get(key, default) for key, default in defaults.items()}
+
     def security_enabled(self) -> bool:
         """Whether stricter file-size and content validation is active."""
         return bool(self.get('app', 'security_enabled', 0))
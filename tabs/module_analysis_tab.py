@@ -58,11 +58,14 @@ _CLUSTERS_PARENT_TEXT = "Clusters"
 class ModuleAnalysisTab(ttk.Frame):
     _last_modules: List[Tuple[str, int, float]]
     _last_module_to_paths: Dict[str, List[str]]
+    _iid_to_key: Dict[str, str]
     _last_G: Any
+    _sorted_nodes: List[str]
     _last_py_files_by_rel: Dict[str, str]
     _last_clusters: List[Tuple[str, List[str], int, float]]
     _last_cluster_to_paths: Dict[str, List[str]]
     _last_linkage_Z: Any
+    _labels_cache: Optional[Tuple[Any, Dict[str, str]]]
     _canvas: Optional[Any]
     _fallback_text: Optional[tk.Text]
     _fallback_var: Optional[tk.StringVar]
@@ -80,11 +83,14 @@ class ModuleAnalysisTab(ttk.Frame):
         self.gui = gui
         self._last_modules = []
         self._last_module_to_paths = {}
+        self._iid_to_key = {}
         self._last_G = None
+        self._sorted_nodes = []
         self._last_py_files_by_rel = {}
         self._last_clusters = []
         self._last_cluster_to_paths = {}
         self._last_linkage_Z = None
+        self._labels_cache = None
         self._canvas = None
         self._fallback_text = None
         self._fallback_var = None
@@ -228,10 +234,17 @@ class ModuleAnalysisTab(ttk.Frame):
         if not enabled_extensions:
             enabled_extensions = set(IMPORT_PATTERNS.keys())
 
+        def progress(done: int, total: int) -> None:
+            self.gui.task_queue.put((self._update_progress, (done, total)))
+
         def worker() -> None:
             try:
                 modules, G, py_files_by_rel, module_to_abs, clusters, linkage_Z = (
-                    modules_with_impact(repo, enabled_extensions=enabled_extensions)
+                    modules_with_impact(
+                        repo,
+                        enabled_extensions=enabled_extensions,
+                        progress_callback=progress,
+                    )
                 )
                 self.gui.task_queue.put(
                     (
@@ -247,6 +260,10 @@ class ModuleAnalysisTab(ttk.Frame):
         self.gui.register_background_thread(t)
         t.start()
 
+    def _update_progress(self, done: int, total: int) -> None:
+        """Show files scanned so far in the status bar (main thread, via task_queue)."""
+        self.gui.show_status_message(f"Analyzing modules... {done}/{total} files")
+
     def _on_analysis_error(self, message: str) -> None:
         self.analyze_btn.config(state=tk.NORMAL)
         self.gui.show_status_message(f"Analysis failed: {message}", error=True)
@@ -264,6 +281,8 @@ class ModuleAnalysisTab(ttk.Frame):
         self._last_modules = modules
         self._last_module_to_paths = module_to_abs_paths
         self._last_G = G
+        # Sorted once per analysis; the fallback view re-renders from this
+        self._sorted_nodes = sorted(G.nodes()) if G is not None else []
         self._last_py_files_by_rel = py_files_by_rel
         self._last_clusters = clusters
         self._last_linkage_Z = linkage_Z
@@ -341,16 +360,20 @@ class ModuleAnalysisTab(ttk.Frame):
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0), pady=(0, 5))
         self._tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         self.tree.delete(*self.tree.get_children())
+        # Map each module row back to its _last_module_to_paths key ("." for root)
+        iid_to_key: Dict[str, str] = {}
         modules_parent = self.tree.insert("", tk.END, text=_MODULES_PARENT_TEXT, values=("", ""), open=True)
         for name, count, impact in self._last_modules:
             display_name = name.replace(os.sep, ".")
-            self.tree.insert(
+            iid = self.tree.insert(
                 modules_parent,
                 tk.END,
                 text=display_name,
                 values=(count, f"{impact:.3f}"),
                 tags=("module",),
             )
+            iid_to_key[iid] = "." if name == "(root)" else name
+        self._iid_to_key = iid_to_key
         clusters_parent = self.tree.insert("", tk.END, text=_CLUSTERS_PARENT_TEXT, values=("", ""), open=True)
         for cname, _mods, file_count, agg_impact in self._last_clusters:
             self.tree.insert(
@@ -417,7 +440,7 @@ class ModuleAnalysisTab(ttk.Frame):
         if self._last_G is not None and nx is not None:
             G = self._last_G
             lines.append(f"Nodes: {G.number_of_nodes()}, Edges: {G.number_of_edges()}\n")
-            for u in sorted(G.nodes()):
+            for u in self._sorted_nodes:
                 succ = list(G.successors(u))
                 if succ:
                     lines.append(f"{u} -> {', '.join(sorted(succ))}\n")
@@ -489,7 +512,7 @@ class ModuleAnalysisTab(ttk.Frame):
         nx.draw_networkx_nodes(
             G, pos, ax=ax_graph, node_color=node_colors, node_size=80
         )
-        labels = {n: os.path.basename(n) if os.path.basename(n) else n for n in G.nodes()}
+        labels = self._graph_labels(G)
         nx.draw_networkx_labels(G, pos, labels, ax=ax_graph, font_size=6)
         ax_graph.axis("off")
         if ax_dendro is not None and scipy_hierarchy is not None and self._last_linkage_Z is not None:
@@ -507,6 +530,15 @@ class ModuleAnalysisTab(ttk.Frame):
         if self._right_container:
             self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)  # type: ignore[no-untyped-call]
 
+    def _graph_labels(self, G: Any) -> Dict[str, str]:
+        """Node labels (basename of module path), computed once per graph."""
+        cached = self._labels_cache
+        if cached is not None and cached[0] is G:
+            return cached[1]
+        labels = {n: (os.path.basename(n) or n) for n in G.nodes()}
+        self._labels_cache = (G, labels)
+        return labels
+
     def _on_select_module(self) -> None:
         gui = cast("RepoPromptGUI", self.gui)
         sel = self.tree.selection()
@@ -518,10 +550,8 @@ class ModuleAnalysisTab(ttk.Frame):
             gui.show_status_message("Select a module from the Modules section.", error=True)
             return
         display_name = item["text"]
-        key = "(root)" if display_name == "(root)" else display_name.replace(".", os.sep)
-        if key not in self._last_module_to_paths:
-            key = display_name
-        paths = self._last_module_to_paths.get(key, [])
+        key = self._iid_to_key.get(sel[0])
+        paths = self._last_module_to_paths.get(key, []) if key is not None else []
         if not paths:
             gui.show_status_message("No files for this module.", error=True)
             return
@@ -640,11 +670,14 @@ class ModuleAnalysisTab(ttk.Frame):
         self.tree.delete(*self.tree.get_children())
         self._last_modules = []
         self._last_module_to_paths = {}
+        self._iid_to_key = {}
         self._last_G = None
+        self._sorted_nodes = []
         self._last_py_files_by_rel = {}
         self._last_clusters = []
         self._last_cluster_to_paths = {}
         self._last_linkage_Z = None
+        self._labels_cache = None
         self._clear_right()
         if self._right_container:
             ph = ttk.Label(
@@ -1,45 +1,122 @@
 from __future__ import annotations
 
+import functools
 import os
 from tkinter import filedialog
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, cast
 
 import tkinter as tk
 import ttkbootstrap as ttk
 
 from constants import TEMPLATE_MARKDOWN, TEMPLATE_XML
 from file_handler import FileHandler
-from widgets import Tooltip
+from widgets import TooltipManager
 
 if TYPE_CHECKING:
     from gui import RepoPromptGUI
 
+_HOME = os.path.expanduser("~")
+
+# ttk state specs for variable-less checkbuttons ("!alternate" clears the tri-state look)
+_CHECKED = ("!alternate", "selected")
+_UNCHECKED = ("!alternate", "!selected")
+
+# Named label styles, configured once per build instead of a font tuple per widget
+_LABEL_STYLE = "SettingsLabel.TLabel"
+_HEADER_STYLE = "SettingsHeader.TLabel"
+
+# Mouse-wheel notches arriving within this window are applied as one scroll (~60 fps)
+_WHEEL_FLUSH_MS = 16
+
+# Checkbuttons per row in the "Recognized Text Extensions" grid
+_EXT_COLUMNS = 5
+
+# (kind, attribute, settings key, default, label text, tooltip, extra) rows for the
+# Performance / Security / Logging sections, built by SettingsTab._add_field.
+# extra is the entry width for "entry", the option list for "combo", unused for "check".
+_Field = Tuple[str, str, str, Any, str, str, Any]
+
+
+def _set_checked(checkbox: ttk.Checkbutton, checked: bool) -> None:
+    """Typed wrapper for Checkbutton.state, which the tkinter stubs leave unannotated."""
+    cast(Any, checkbox).state(_CHECKED if checked else _UNCHECKED)
+
+
+def _is_checked(checkbox: ttk.Checkbutton) -> bool:
+    """Typed wrapper for Checkbutton.instate(["selected"])."""
+    return bool(cast(Any, checkbox).instate(["selected"]))
+
+
+def _canvas_y(canvas: tk.Canvas, screen_y: int) -> float:
+    """Typed wrapper for Canvas.canvasy (window y to canvas y)."""
+    return float(cast(Any, canvas).canvasy(screen_y))
+
+
+_FIELD_SECTIONS: Tuple[Tuple[str, Tuple[_Field, ...]], ...] = (
+    ("Performance Settings", (
+        ("entry", "cache_max_size_entry", "cache_max_size", 1000,
+         "Cache Max Items:", "Max files to keep in RAM.", 12),
+        ("entry", "cache_max_memory_entry", "cache_max_memory_mb", 100,
+         "Cache Max Memory (MB):", "Hard memory limit (MB) for cache.", 12),
+        ("entry", "tree_max_items_entry", "tree_max_items", 10000,
+         "Tree Safety Limit:", "Max items to process recursively to prevent freezing.", 12),
+    )),
+    ("Security Settings", (
+        ("check", "security_enabled_var", "security_enabled", 0,
+         "Enable Security Validation",
+         "When enabled, applies stricter file-size and content checks "
+         "(HTML/XML/SVG, large files) before inclusion. Default is off for normal local use.", None),
+        ("entry", "max_file_size_entry", "max_file_size_mb", 10,
+         "Max File Size (MB):", "Skip files larger than this (MB).", 10),
+    )),
+    ("Logging & Debugging", (
+        ("combo", "log_level_menu", "log_level", "INFO",
+         "Log Level:", "DEBUG for dev, INFO for normal usage.",
+         ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")),
+        ("check", "log_to_file_var", "log_to_file", 1,
+         "Log to File (codebase_debug.log)", "Save logs to codebase_debug.log.", None),
+        ("check", "log_to_console_var", "log_to_console", 1,
+         "Log to Console (Stdout)", "Print logs to the terminal window.", None),
+    )),
+)
+
 
 class SettingsTab(ttk.Frame):
+    SEARCHABLE = False  # SearchHandler skips this tab; it has no search/highlight hooks
     gui: RepoPromptGUI
     settings: Any  # config parser / custom settings object
     high_contrast_mode: tk.BooleanVar
-    exclude_file_vars: Dict[str, tk.IntVar]
-    extension_checkboxes: Dict[str, Tuple[ttk.Checkbutton, tk.IntVar]]
-    default_tab_var: tk.StringVar
-    expansion_var: tk.StringVar
-    copy_format_var: tk.StringVar
-    levels_var: tk.StringVar
+    exclude_file_checkboxes: Dict[str, ttk.Checkbutton]
+    _exclude_state: Dict[str, int]
+    extension_checkboxes: Dict[str, ttk.Checkbutton]
+    _ext_state: Dict[str, int]
+    _pending_ext_groups: List[Tuple[ttk.Label, ttk.Frame, Tuple[str, ...]]]
+    _materialize_job: Optional[str]
+    _scroll_region_job: Optional[str]
+    _wheel_job: Optional[str]
+    _wheel_units: int
+    _ui_built: bool
+    _last_valid_folder: Optional[str]
+    _tooltips: TooltipManager
     exclude_node_modules_var: tk.IntVar
     exclude_venv_var: tk.IntVar
     exclude_dist_var: tk.IntVar
     exclude_coverage_var: tk.IntVar
     exclude_lock_files_var: tk.IntVar
     include_icons_var: tk.IntVar
+    settings_tooltips_var: tk.IntVar
     canvas: tk.Canvas
-    inner_frame: tk.Frame
+    inner_frame: ttk.Frame
+    default_tab_menu: ttk.Combobox
+    copy_format_menu: ttk.Combobox
+    expansion_menu: ttk.Combobox
     levels_entry: ttk.Entry
-    cache_max_size_var: tk.StringVar
-    cache_max_memory_var: tk.StringVar
-    tree_max_items_var: tk.StringVar
+    cache_max_size_entry: ttk.Entry
+    cache_max_memory_entry: ttk.Entry
+    tree_max_items_entry: ttk.Entry
     security_enabled_var: tk.IntVar
-    max_file_size_var: tk.StringVar
-    log_level_var: tk.StringVar
+    max_file_size_entry: ttk.Entry
+    log_level_menu: ttk.Combobox
     log_to_file_var: tk.IntVar
     log_to_console_var: tk.IntVar
     default_start_folder_var: tk.StringVar
@@ -56,263 +133,352 @@ class SettingsTab(ttk.Frame):
         self.gui = gui
         self.settings = settings
         self.high_contrast_mode = high_contrast_mode
-        self.exclude_file_vars = {}
+        self.exclude_file_checkboxes = {}
+        self._exclude_state = {}
         self.extension_checkboxes = {}
-        self.default_tab_var = tk.StringVar(value=self.settings.get('app', 'default_tab', 'Content Preview'))
-        self.expansion_var = tk.StringVar(value=self.settings.get('app', 'expansion', 'Collapsed'))
-        self.copy_format_var = tk.StringVar(value=self.settings.get('app', 'copy_format', TEMPLATE_MARKDOWN))
-        self.levels_var = tk.StringVar(value=str(self.settings.get('app', 'levels', 1)))
-        self.exclude_node_modules_var = tk.IntVar(value=self.settings.get('app', 'exclude_node_modules', 1))
-        self.exclude_venv_var = tk.IntVar(value=self.settings.get('app', 'exclude_venv', 1))
-        self.exclude_dist_var = tk.IntVar(value=self.settings.get('app', 'exclude_dist', 1))
-        self.exclude_coverage_var = tk.IntVar(value=self.settings.get('app', 'exclude_coverage', 1))
-        self.exclude_lock_files_var = tk.IntVar(value=self.settings.get('app', 'exclude_lock_files', 1))
-        self.include_icons_var = tk.IntVar(value=self.settings.get('app', 'include_icons', 1))
+        self._ext_state = {}
+        self._pending_ext_groups = []
+        self._materialize_job = None
+        self._scroll_region_job = None
+        self._wheel_job = None
+        self._wheel_units = 0
+        self._ui_built = False
+        self._last_valid_folder = None
+        values = self.settings.get_many('app', {
+            'exclude_node_modules': 1,
+            'exclude_venv': 1,
+            'exclude_dist': 1,
+            'exclude_coverage': 1,
+            'exclude_lock_files': 1,
+            'include_icons': 1,
+            'settings_tooltips': 1,
+        })
+        self.exclude_node_modules_var = tk.IntVar(value=values['exclude_node_modules'])
+        self.exclude_venv_var = tk.IntVar(value=values['exclude_venv'])
+        self.exclude_dist_var = tk.IntVar(value=values['exclude_dist'])
+        self.exclude_coverage_var = tk.IntVar(value=values['exclude_coverage'])
+        self.exclude_lock_files_var = tk.IntVar(value=values['exclude_lock_files'])
+        self.include_icons_var = tk.IntVar(value=values['include_icons'])
+        self.settings_tooltips_var = tk.IntVar(value=values['settings_tooltips'])
+        # One shared bind tag and tip window for the ~140 tooltips on this tab
+        self._tooltips = TooltipManager(self, enabled=bool(values['settings_tooltips']))
         self.setup_ui()
 
     def setup_ui(self) -> None:
+        """Build the scroll container now; the form itself waits until the tab is first shown."""
+        self._build_chrome()
+        self.bind("<Map>", self.ensure_ui)
+
+    def ensure_ui(self, event: Optional[tk.Event[Any]] = None) -> None:
+        """Build the settings form if it has not been built yet.
+
+        Runs from the first <Map> of the tab, and is called directly by code that
+        reads the form's widgets before the user has opened the tab.
+        """
+        if self._ui_built:
+            return
+        self._ui_built = True
+        self.unbind("<Map>")
+        self._build_body()
+
+    def _build_chrome(self) -> None:
         scroll_frame = ttk.Scrollbar(self, orient="vertical")
         scroll_frame.pack(side=tk.RIGHT, fill=tk.Y)
 
-        canvas = tk.Canvas(self, yscrollcommand=scroll_frame.set)
+        def _on_yview(first: float, last: float) -> None:
+            scroll_frame.set(first, last)
+            self._schedule_materialize()
+
+        canvas = tk.Canvas(self, yscrollcommand=_on_yview)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         scroll_frame.config(command=canvas.yview)
 
-        inner_frame = tk.Frame(canvas)
+        inner_frame = ttk.Frame(canvas)
         canvas.create_window((0, 0), window=inner_frame, anchor="nw")
 
         def _on_configure(event: tk.Event[Any]) -> None:
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            # Fold bursts of resizes into one scrollregion update per idle cycle
+            if self._scroll_region_job is None:
+                self._scroll_region_job = self.after_idle(self._apply_scroll_region)
 
         def _on_mousewheel(event: tk.Event[Any]) -> None:
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            # Windows reports multiples of 120 per notch, macOS small raw deltas
+            if event.delta:
+                self._queue_scroll(-int(event.delta / 120) or (-1 if event.delta > 0 else 1))
 
         inner_frame.bind("<Configure>", _on_configure)
 
         # Linux/X11: mouse wheel events may arrive as Button-4/Button-5
-        canvas.bind('<Button-4>', lambda e: canvas.yview_scroll(-1, "units"))
-        canvas.bind('<Button-5>', lambda e: canvas.yview_scroll(1, "units"))
+        canvas.bind('<Button-4>', lambda e: self._queue_scroll(-1))
+        canvas.bind('<Button-5>', lambda e: self._queue_scroll(1))
         canvas.bind('<MouseWheel>', _on_mousewheel)
-        inner_frame.bind('<Button-4>', lambda e: canvas.yview_scroll(-1, "units"))
-        inner_frame.bind('<Button-5>', lambda e: canvas.yview_scroll(1, "units"))
+        # Showing the tab again resumes any extension groups left unbuilt when it was hidden
+        canvas.bind('<Map>', lambda e: self._schedule_materialize())
+        inner_frame.bind('<Button-4>', lambda e: self._queue_scroll(-1))
+        inner_frame.bind('<Button-5>', lambda e: self._queue_scroll(1))
+        inner_frame.bind('<MouseWheel>', _on_mousewheel)
 
         self.canvas = canvas
         self.inner_frame = inner_frame
 
+    def _build_body(self) -> None:
+        inner_frame = self.inner_frame
+        tooltips = self._tooltips
+        # One section fetch for every value the form seeds from
+        app_settings = self.settings.get_section('app')
+        style = ttk.Style()  # type: ignore[no-untyped-call]
+        style.configure(_LABEL_STYLE, font=("Arial", 10, "bold"))
+        style.configure(_HEADER_STYLE, font=("Arial", 12, "bold"))
+
         # Default Tab Selection
-        default_tab_label = ttk.Label(inner_frame, text="Default Tab:", font=("Arial", 10, "bold"))
+        default_tab_label = ttk.Label(inner_frame, text="Default Tab:", style=_LABEL_STYLE)
         default_tab_label.grid(row=0, column=0, padx=20, pady=10, sticky="w")
-        Tooltip(default_tab_label, "Select which tab is active when the application starts.")
         default_tab_options = ["Content Preview", "Folder Structure", "Base Prompt", "Settings", "File List Selection"]
-        default_tab_menu = ttk.Combobox(inner_frame, textvariable=self.default_tab_var, values=default_tab_options, state="readonly", width=20)
+        default_tab_menu = ttk.Combobox(inner_frame, values=default_tab_options, state="readonly", width=20)
+        default_tab_menu.set(app_settings.get('default_tab', 'Content Preview'))
+        self.default_tab_menu = default_tab_menu
         default_tab_menu.grid(row=0, column=1, padx=20, pady=10, sticky="w")
-        Tooltip(default_tab_menu, "Select which tab is active when the application starts.")
+        tooltips.register(default_tab_menu, "Select which tab is active when the application starts.")
         # Default Copy Format
-        format_label = ttk.Label(inner_frame, text="Default Copy Format:", font=("Arial", 10, "bold"))
+        format_label = ttk.Label(inner_frame, text="Default Copy Format:", style=_LABEL_STYLE)
         format_label.grid(row=1, column=0, padx=20, pady=10, sticky="w")
-        Tooltip(format_label, "Select the default format for copying content.")
         format_options = [TEMPLATE_MARKDOWN, TEMPLATE_XML]
-        format_menu = ttk.Combobox(inner_frame, textvariable=self.copy_format_var, values=format_options, state="readonly", width=20)
+        format_menu = ttk.Combobox(inner_frame, values=format_options, state="readonly", width=20)
+        format_menu.set(app_settings.get('copy_format', TEMPLATE_MARKDOWN))
+        self.copy_format_menu = format_menu
         format_menu.grid(row=1, column=1, padx=20, pady=10, sticky="w")
-        Tooltip(format_menu, "Select the default format for copying content.")
+        tooltips.register(format_menu, "Select the default format for copying content.")
         # Expansion Settings
-        expansion_label = ttk.Label(inner_frame, text="Initial Expansion:", font=("Arial", 10, "bold"))
+        expansion_label = ttk.Label(inner_frame, text="Initial Expansion:", style=_LABEL_STYLE)
         expansion_label.grid(row=2, column=0, padx=20, pady=10, sticky="w")
-        Tooltip(expansion_label, "How folders display on load.\nCollapsed: Only root.\nExpanded: All open.\nLevels: Specific depth.")
         expansion_options = ["Collapsed", "Expanded", "Levels"]
-        expansion_menu = ttk.Combobox(inner_frame, textvariable=self.expansion_var, values=expansion_options, state="readonly", width=20)
+        expansion_menu = ttk.Combobox(inner_frame, values=expansion_options, state="readonly", width=20)
+        expansion_menu.set(app_settings.get('expansion', 'Collapsed'))
+        self.expansion_menu = expansion_menu
         expansion_menu.grid(row=2, column=1, padx=20, pady=10, sticky="w")
-        Tooltip(expansion_menu, "How folders display on load.\nCollapsed: Only root.\nExpanded: All open.\nLevels: Specific depth.")
+        tooltips.register(expansion_menu, "How folders display on load.\nCollapsed: Only root.\nExpanded: All open.\nLevels: Specific depth.")
         # Expansion Levels
-        levels_label = ttk.Label(inner_frame, text="Expansion Levels:", font=("Arial", 10, "bold"))
+        levels_label = ttk.Label(inner_frame, text="Expansion Levels:", style=_LABEL_STYLE)
         levels_label.grid(row=3, column=0, padx=20, pady=10, sticky="w")
-        Tooltip(levels_label, "Depth level for 'Levels' mode (e.g., 2).")
-        self.levels_entry = ttk.Entry(inner_frame, textvariable=self.levels_var, width=8)
+        self.levels_entry = ttk.Entry(inner_frame, width=8)
+        self.levels_entry.insert(0, str(app_settings.get('levels', 1)))
         self.levels_entry.grid(row=3, column=1, padx=20, pady=10, sticky="w")
-        Tooltip(self.levels_entry, "Depth level for 'Levels' mode (e.g., 2).")
+        tooltips.register(self.levels_entry, "Depth level for 'Levels' mode (e.g., 2).")
+        # Settings tab tooltips (applied live through the tab's TooltipManager)
+        show_tooltips_checkbox = ttk.Checkbutton(inner_frame, text="Show Tooltips on Settings Tab",
+                                                 variable=self.settings_tooltips_var,
+                                                 command=self._on_tooltips_toggled)
+        show_tooltips_checkbox.grid(row=4, column=0, columnspan=2, padx=20, pady=10, sticky="w")
+        tooltips.register(show_tooltips_checkbox, "Show hover help for the options on this tab.")
         # File Exclusion Settings
-        exclusion_label = ttk.Label(inner_frame, text="File Exclusion Settings", font=("Arial", 12, "bold"))
-        exclusion_label.grid(row=4, column=0, columnspan=2, padx=20, pady=(15, 10), sticky="w")
+        exclusion_label = ttk.Label(inner_frame, text="File Exclusion Settings", style=_HEADER_STYLE)
+        exclusion_label.grid(row=5, column=0, columnspan=2, padx=20, pady=(15, 10), sticky="w")
         
         # Exclude node_modules
         exclude_node_modules_checkbox = ttk.Checkbutton(inner_frame, text="Exclude node_modules", variable=self.exclude_node_modules_var)
-        exclude_node_modules_checkbox.grid(row=5, column=0, columnspan=2, padx=25, pady=4, sticky="w")
-        Tooltip(exclude_node_modules_checkbox, "Hide 'node_modules' folders.")
+        exclude_node_modules_checkbox.grid(row=6, column=0, columnspan=2, padx=25, pady=4, sticky="w")
+        tooltips.register(exclude_node_modules_checkbox, "Hide 'node_modules' folders.")
         exclude_venv_checkbox = ttk.Checkbutton(inner_frame, text="Exclude virtual environments", variable=self.exclude_venv_var)
-        exclude_venv_checkbox.grid(row=6, column=0, columnspan=2, padx=25, pady=4, sticky="w")
-        Tooltip(exclude_venv_checkbox, "Hide .venv, venv, and virtualenv folders (not bare env/ or .env/).")
+        exclude_venv_checkbox.grid(row=7, column=0, columnspan=2, padx=25, pady=4, sticky="w")
+        tooltips.register(exclude_venv_checkbox, "Hide .venv, venv, and virtualenv folders (not bare env/ or .env/).")
         # Exclude dist/build folders
         exclude_dist_checkbox = ttk.Checkbutton(inner_frame, text="Exclude dist/build folders", variable=self.exclude_dist_var)
-        exclude_dist_checkbox.grid(row=7, column=0, columnspan=2, padx=25, pady=4, sticky="w")
-        Tooltip(exclude_dist_checkbox, "Hide build output directories.")
+        exclude_dist_checkbox.grid(row=8, column=0, columnspan=2, padx=25, pady=4, sticky="w")
+        tooltips.register(exclude_dist_checkbox, "Hide build output directories.")
         # Exclude coverage folders
         exclude_coverage_checkbox = ttk.Checkbutton(inner_frame, text="Exclude Coverage folders", variable=self.exclude_coverage_var)
-        exclude_coverage_checkbox.grid(row=8, column=0, columnspan=2, padx=25, pady=4, sticky="w")
-        Tooltip(exclude_coverage_checkbox, "Hide coverage report folders.")
+        exclude_coverage_checkbox.grid(row=9, column=0, columnspan=2, padx=25, pady=4, sticky="w")
+        tooltips.register(exclude_coverage_checkbox, "Hide coverage report folders.")
         # Exclude All Lock Files (Global)
         exclude_lock_files_checkbox = ttk.Checkbutton(inner_frame, text="Exclude All Lock Files (Global)", variable=self.exclude_lock_files_var)
-        exclude_lock_files_checkbox.grid(row=9, column=0, columnspan=2, padx=25, pady=4, sticky="w")
-        Tooltip(exclude_lock_files_checkbox, "Hide all lock files (pnpm-lock.yaml, yarn.lock, package-lock.json, etc.) globally.")
+        exclude_lock_files_checkbox.grid(row=10, column=0, columnspan=2, padx=25, pady=4, sticky="w")
+        tooltips.register(exclude_lock_files_checkbox, "Hide all lock files (pnpm-lock.yaml, yarn.lock, package-lock.json, etc.) globally.")
         # Exclude Specific Files
-        exclude_files_label = ttk.Label(inner_frame, text="Exclude Specific Files:", font=("Arial", 10, "bold"))
-        exclude_files_label.grid(row=10, column=0, columnspan=2, padx=25, pady=(15, 8), sticky="w")
-        Tooltip(exclude_files_label, "Check to hide specific lock files.")
-        exclude_files = self.settings.get('app', 'exclude_files', {})
-        row = 11
+        exclude_files_label = ttk.Label(inner_frame, text="Exclude Specific Files:", style=_LABEL_STYLE)
+        exclude_files_label.grid(row=11, column=0, columnspan=2, padx=25, pady=(15, 8), sticky="w")
+        tooltips.register(exclude_files_label, "Check to hide specific lock files.")
+        exclude_files = app_settings.get('exclude_files', {})
+        exclude_state = self._exclude_state
+        exclude_checkboxes = self.exclude_file_checkboxes
+        exclude_grid_opts: Dict[str, Any] = {"column": 0, "columnspan": 2, "padx": 35, "pady": 2, "sticky": "w"}
+        on_toggled = self._on_check_toggled
+        partial = functools.partial
+        register_tooltip = tooltips.register
+        set_checked = _set_checked
+        row = 12
         for file, value in exclude_files.items():
-            var = tk.IntVar(value=value)
-            checkbox = ttk.Checkbutton(inner_frame, text=file, variable=var)
-            checkbox.grid(row=row, column=0, columnspan=2, padx=35, pady=2, sticky="w")
-            Tooltip(checkbox, f"If checked, '{file}' will be hidden from the file tree.")
-            self.exclude_file_vars[file] = var
+            exclude_state[file] = value
+            checkbox = ttk.Checkbutton(
+                inner_frame,
+                text=file,
+                command=partial(on_toggled, file, exclude_checkboxes, exclude_state),
+            )
+            set_checked(checkbox, bool(value))
+            checkbox.grid(row=row, **exclude_grid_opts)
+            register_tooltip(checkbox, f"If checked, '{file}' will be hidden from the file tree.")
+            exclude_checkboxes[file] = checkbox
             row += 1
 
         # Include Icons
         include_icons_checkbox = ttk.Checkbutton(inner_frame, text="Include Icons in Structure", variable=self.include_icons_var)
         include_icons_checkbox.grid(row=row, column=0, columnspan=2, padx=25, pady=8, sticky="w")
-        Tooltip(include_icons_checkbox, "Add 📁/📄 emojis to 'Copy Structure' text.")
-        row += 1
-
-        # --- Performance Settings ---
-        performance_label = ttk.Label(inner_frame, text="Performance Settings", font=("Arial", 12, "bold"))
-        performance_label.grid(row=row, column=0, columnspan=2, padx=20, pady=(20, 10), sticky="w")
-        row += 1
-
-        # Cache settings
-        self.cache_max_size_var = tk.StringVar(value=str(self.settings.get('app', 'cache_max_size', 1000)))
-        cache_size_label = ttk.Label(inner_frame, text="Cache Max Items:", font=("Arial", 10, "bold"))
-        cache_size_label.grid(row=row, column=0, padx=25, pady=5, sticky="w")
-        Tooltip(cache_size_label, "Max files to keep in RAM.")
-        cache_size_entry = ttk.Entry(inner_frame, textvariable=self.cache_max_size_var, width=12)
-        cache_size_entry.grid(row=row, column=1, padx=25, pady=5, sticky="w")
-        Tooltip(cache_size_entry, "Max files to keep in RAM.")
-        row += 1
-
-        self.cache_max_memory_var = tk.StringVar(value=str(self.settings.get('app', 'cache_max_memory_mb', 100)))
-        cache_memory_label = ttk.Label(inner_frame, text="Cache Max Memory (MB):", font=("Arial", 10, "bold"))
-        cache_memory_label.grid(row=row, column=0, padx=25, pady=5, sticky="w")
-        Tooltip(cache_memory_label, "Hard memory limit (MB) for cache.")
-        cache_memory_entry = ttk.Entry(inner_frame, textvariable=self.cache_max_memory_var, width=12)
-        cache_memory_entry.grid(row=row, column=1, padx=25, pady=5, sticky="w")
-        Tooltip(cache_memory_entry, "Hard memory limit (MB) for cache.")
-        row += 1
-
-        # Tree operation settings
-        self.tree_max_items_var = tk.StringVar(value=str(self.settings.get('app', 'tree_max_items', 10000)))
-        tree_items_label = ttk.Label(inner_frame, text="Tree Safety Limit:", font=("Arial", 10, "bold"))
-        tree_items_label.grid(row=row, column=0, padx=25, pady=5, sticky="w")
-        Tooltip(tree_items_label, "Max items to process recursively to prevent freezing.")
-        tree_items_entry = ttk.Entry(inner_frame, textvariable=self.tree_max_items_var, width=12)
-        tree_items_entry.grid(row=row, column=1, padx=25, pady=5, sticky="w")
-        Tooltip(tree_items_entry, "Max items to process recursively to prevent freezing.")
-        row += 1
-
-        # --- Security Settings ---
-        security_label = ttk.Label(inner_frame, text="Security Settings", font=("Arial", 12, "bold"))
-        security_label.grid(row=row, column=0, columnspan=2, padx=20, pady=(20, 10), sticky="w")
-        row += 1
-
-        self.security_enabled_var = tk.IntVar(value=self.settings.get('app', 'security_enabled', 0))
-        security_enabled_checkbox = ttk.Checkbutton(inner_frame, text="Enable Security Validation", variable=self.security_enabled_var)
-        security_enabled_checkbox.grid(row=row, column=0, columnspan=2, padx=25, pady=5, sticky="w")
-        Tooltip(
-            security_enabled_checkbox,
-            "When enabled, applies stricter file-size and content checks "
-            "(HTML/XML/SVG, large files) before inclusion. Default is off for normal local use.",
-        )
+        tooltips.register(include_icons_checkbox, "Add 📁/📄 emojis to 'Copy Structure' text.")
         row += 1
 
-        self.max_file_size_var = tk.StringVar(value=str(self.settings.get('app', 'max_file_size_mb', 10)))
-        max_file_size_label = ttk.Label(inner_frame, text="Max File Size (MB):", font=("Arial", 10, "bold"))
-        max_file_size_label.grid(row=row, column=0, padx=25, pady=5, sticky="w")
-        Tooltip(max_file_size_label, "Skip files larger than this (MB).")
-        max_file_size_entry = ttk.Entry(inner_frame, textvariable=self.max_file_size_var, width=10)
-        max_file_size_entry.grid(row=row, column=1, padx=25, pady=5, sticky="w")
-        Tooltip(max_file_size_entry, "Skip files larger than this (MB).")
-        row += 1
-
-        # --- Logging Settings ---
-        logging_label = ttk.Label(inner_frame, text="Logging & Debugging", font=("Arial", 12, "bold"))
-        logging_label.grid(row=row, column=0, columnspan=2, padx=20, pady=(20, 10), sticky="w")
-        row += 1
-
-        # Log level
-        self.log_level_var = tk.StringVar(value=self.settings.get('app', 'log_level', 'INFO'))
-        log_level_label = ttk.Label(inner_frame, text="Log Level:", font=("Arial", 10, "bold"))
-        log_level_label.grid(row=row, column=0, padx=25, pady=5, sticky="w")
-        Tooltip(log_level_label, "DEBUG for dev, INFO for normal usage.")
-        log_level_options = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        log_level_menu = ttk.Combobox(inner_frame, textvariable=self.log_level_var, values=log_level_options, state="readonly", width=15)
-        log_level_menu.grid(row=row, column=1, padx=25, pady=5, sticky="w")
-        Tooltip(log_level_menu, "DEBUG for dev, INFO for normal usage.")
-        row += 1
-
-        # Log to file
-        self.log_to_file_var = tk.IntVar(value=self.settings.get('app', 'log_to_file', 1))
-        log_to_file_checkbox = ttk.Checkbutton(inner_frame, text="Log to File (codebase_debug.log)", variable=self.log_to_file_var)
-        log_to_file_checkbox.grid(row=row, column=0, columnspan=2, padx=25, pady=5, sticky="w")
-        Tooltip(log_to_file_checkbox, "Save logs to codebase_debug.log.")
-        row += 1
-
-        # Log to console
-        self.log_to_console_var = tk.IntVar(value=self.settings.get('app', 'log_to_console', 1))
-        log_to_console_checkbox = ttk.Checkbutton(inner_frame, text="Log to Console (Stdout)", variable=self.log_to_console_var)
-        log_to_console_checkbox.grid(row=row, column=0, columnspan=2, padx=25, pady=5, sticky="w")
-        Tooltip(log_to_console_checkbox, "Print logs to the terminal window.")
-        row += 1
+        # --- Performance, Security and Logging Settings ---
+        add_field = self._add_field
+        for section_title, fields in _FIELD_SECTIONS:
+            section_label = ttk.Label(inner_frame, text=section_title, style=_HEADER_STYLE)
+            section_label.grid(row=row, column=0, columnspan=2, padx=20, pady=(20, 10), sticky="w")
+            row += 1
+            for spec in fields:
+                row = add_field(inner_frame, row, spec, app_settings)
 
         # --- Folder Selection Settings ---
-        folder_selection_label = ttk.Label(inner_frame, text="Folder Defaults", font=("Arial", 12, "bold"))
+        folder_selection_label = ttk.Label(inner_frame, text="Folder Defaults", style=_HEADER_STYLE)
         folder_selection_label.grid(row=row, column=0, columnspan=2, padx=20, pady=(20, 10), sticky="w")
         row += 1
 
         # Default start folder
-        self.default_start_folder_var = tk.StringVar(value=self.settings.get('app', 'default_start_folder', os.path.expanduser("~")))
-        default_folder_label = ttk.Label(inner_frame, text="Default Start Folder:", font=("Arial", 10, "bold"))
+        self.default_start_folder_var = tk.StringVar(value=app_settings.get('default_start_folder', _HOME))
+        default_folder_label = ttk.Label(inner_frame, text="Default Start Folder:", style=_LABEL_STYLE)
         default_folder_label.grid(row=row, column=0, padx=25, pady=5, sticky="w")
-        Tooltip(default_folder_label, "Starting directory for 'Select Repo'.")
         default_folder_frame = ttk.Frame(inner_frame)
         default_folder_frame.grid(row=row, column=1, padx=25, pady=5, sticky="ew")
 
         self.default_folder_entry = ttk.Entry(default_folder_frame, textvariable=self.default_start_folder_var, width=30)
         self.default_folder_entry.pack(side=tk.LEFT, fill="x", expand=True)
-        Tooltip(self.default_folder_entry, "Starting directory for 'Select Repo'.")        
+        tooltips.register(self.default_folder_entry, "Starting directory for 'Select Repo'.")        
         browse_folder_button = ttk.Button(default_folder_frame, text="Browse...", command=self._browse_default_folder, width=10)
         browse_folder_button.pack(side=tk.RIGHT, padx=(5, 0))
         row += 1
 
         # --- Text File Extensions ---
-        extensions_label = ttk.Label(inner_frame, text="Recognized Text Extensions", font=("Arial", 12, "bold"))
+        extensions_label = ttk.Label(inner_frame, text="Recognized Text Extensions", style=_HEADER_STYLE)
         extensions_label.grid(row=row, column=0, columnspan=2, padx=20, pady=(20, 10), sticky="w")
         row += 1
 
-        extension_groups = FileHandler.get_extension_groups()
-        for group, extensions in extension_groups.items():
-            group_label = ttk.Label(inner_frame, text=group, font=("Arial", 10, "bold"))
+        # Checkbuttons are only created once a group scrolls into view (see
+        # _materialize_visible_groups); until then the group is just its state.
+        text_extensions = app_settings.get('text_extensions', {}) or {}
+        ext_state = self._ext_state
+        pending = self._pending_ext_groups
+        for group, extensions in FileHandler.get_sorted_extension_groups():
+            group_label = ttk.Label(inner_frame, text=group, style=_LABEL_STYLE)
             group_label.grid(row=row, column=0, columnspan=2, padx=25, pady=8, sticky="w")
             row += 1
-
-            ext_row = row
-            col = 0
-            for ext in sorted(extensions):
-                var = tk.IntVar(value=self.settings.get('app', 'text_extensions', {}).get(ext, 1))
-                cb = ttk.Checkbutton(inner_frame, text=ext, variable=var)
-                cb.grid(row=ext_row, column=col, padx=35, pady=2, sticky="w")
-                Tooltip(cb, f"Include {ext} files in scans")
-                self.extension_checkboxes[ext] = (cb, var)
-                col += 1
-                if col > 4: # Wrap every 5 columns
-                    col = 0
-                    ext_row += 1
-            row = ext_row + 1
+            group_frame = ttk.Frame(inner_frame)
+            group_frame.grid(row=row, column=0, columnspan=2, padx=10, sticky="w")
+            row += 1
+            ext_state.update((ext, text_extensions.get(ext, 1)) for ext in extensions)
+            pending.append((group_label, group_frame, extensions))
 
         # --- Save Button ---
-        save_button = self.gui.create_button(cast(Any, inner_frame), "Save All Settings", self.gui.save_app_settings, "Apply and save these settings permanently.")
+        # No tooltip_text: create_button's standalone Tooltip would ignore the tab's tooltip toggle
+        save_button = self.gui.create_button(inner_frame, "Save All Settings", self.gui.save_app_settings)
+        tooltips.register(save_button, "Apply and save these settings permanently.")
         save_button.grid(row=row, column=0, columnspan=2, pady=(30, 20), padx=20)
         # Make the save button big
         save_button.config(width=20)
 
+    def _add_field(self, parent: ttk.Frame, row: int, spec: _Field, app_settings: Mapping[str, Any]) -> int:
+        """Build one _FIELD_SECTIONS row at the given grid row; returns the next free row."""
+        kind, attr, key, default, text, tip, extra = spec
+        value = app_settings.get(key, default)
+        register_tooltip = self._tooltips.register
+        if kind == "check":
+            var = tk.IntVar(value=value)
+            checkbox = ttk.Checkbutton(parent, text=text, variable=var)
+            checkbox.grid(row=row, column=0, columnspan=2, padx=25, pady=5, sticky="w")
+            register_tooltip(checkbox, tip)
+            setattr(self, attr, var)
+            return row + 1
+        label = ttk.Label(parent, text=text, style=_LABEL_STYLE)
+        if kind == "combo":
+            # No StringVar, like the other comboboxes: save_app_settings reads the widget itself
+            combo = ttk.Combobox(parent, values=list(extra), state="readonly", width=15)
+            combo.set(str(value))
+            control: tk.Widget = combo
+            setattr(self, attr, combo)
+        else:
+            # Free-text numeric field: no StringVar, save_app_settings reads the entry itself
+            entry = ttk.Entry(parent, width=extra)
+            entry.insert(0, str(value))
+            control = entry
+            setattr(self, attr, entry)
+        register_tooltip(control, tip)
+        # Label and control share a row: one grid call puts them in columns 0 and 1
+        parent.tk.call("grid", "configure", str(label), str(control),
+                       "-row", row, "-padx", 25, "-pady", 5, "-sticky", "w")
+        return row + 1
+
+    def _schedule_materialize(self) -> None:
+        """Coalesce scroll/resize notifications into one materialize pass per idle cycle."""
+        if self._pending_ext_groups and self._materialize_job is None:
+            self._materialize_job = self.after_idle(self._materialize_visible_groups)
+
+    def _materialize_visible_groups(self) -> None:
+        """Build the checkbuttons of the next extension group if its header is near the viewport.
+
+        One group is built per pass; the pass reschedules itself so the next header's
+        position is read after the grid has laid out the group just added.
+        """
+        self._materialize_job = None
+        if not self._pending_ext_groups or not self.canvas.winfo_ismapped():
+            return  # re-triggered by the canvas <Map> binding once the tab is shown again
+        canvas_height = self.canvas.winfo_height()
+        # Look one screen ahead so groups are ready before they scroll in
+        visible_bottom = _canvas_y(self.canvas, canvas_height) + canvas_height
+        group_label, group_frame, extensions = self._pending_ext_groups[0]
+        if group_label.winfo_y() > visible_bottom:
+            return
+        self._pending_ext_groups.pop(0)
+        self._build_extension_group(group_frame, extensions)
+        if not self._pending_ext_groups:
+            self.canvas.unbind('<Map>')
+            return
+        self._schedule_materialize()
+
+    def _build_extension_group(self, group_frame: ttk.Frame, extensions: Tuple[str, ...]) -> None:
+        # Loop invariants bound once; this runs for every extension in the group
+        ext_state = self._ext_state
+        checkboxes = self.extension_checkboxes
+        on_toggled = self._on_check_toggled
+        partial = functools.partial
+        register_tooltip = self._tooltips.register
+        set_checked = _set_checked
+        paths: List[str] = []
+        for ext in extensions:
+            cb = ttk.Checkbutton(group_frame, text=ext, command=partial(on_toggled, ext, checkboxes, ext_state))
+            # No variable: checked state lives on the widget and is mirrored into ext_state
+            set_checked(cb, bool(ext_state.get(ext, 1)))
+            register_tooltip(cb, f"Include {ext} files in scans")
+            checkboxes[ext] = cb
+            paths.append(str(cb))
+        # One grid call per row: Tk lays multiple slaves out in successive columns from 0
+        call = group_frame.tk.call
+        for start in range(0, len(paths), _EXT_COLUMNS):
+            call("grid", "configure", *paths[start:start + _EXT_COLUMNS],
+                 "-row", start // _EXT_COLUMNS, "-padx", 25, "-pady", 2, "-sticky", "w")
+
+    def get_exclude_selection(self) -> Dict[str, int]:
+        """Return a copy of the exclude-file checkbox states (name -> 0/1)."""
+        return dict(self._exclude_state)
+
+    def get_extension_selection(self) -> Dict[str, int]:
+        """Return a copy of the text-extension checkbox states (extension -> 0/1)."""
+        return dict(self._ext_state)
+
+    def _on_tooltips_toggled(self) -> None:
+        """Apply the Show Tooltips checkbox to the tab's tips immediately."""
+        self._tooltips.set_enabled(bool(self.settings_tooltips_var.get()))
+
+    @staticmethod
+    def _on_check_toggled(key: str, checkboxes: Dict[str, ttk.Checkbutton], store: Dict[str, int]) -> None:
+        """Mirror a variable-less checkbutton's selected state into its state dict."""
+        store[key] = 1 if _is_checked(checkboxes[key]) else 0
+
     def _toggle_theme(self) -> None:
         """Toggle between dark and light themes and update styles."""
         style = cast(Any, self.gui.root.style)
@@ -328,36 +494,42 @@ class SettingsTab(ttk.Frame):
     def _browse_default_folder(self) -> None:
         """Open folder selection dialog for default start folder."""
         current_folder = self.default_start_folder_var.get()
-        if not os.path.exists(current_folder):
-            current_folder = os.path.expanduser("~")
-        
+        # Only stat the entry when it differs from the folder last confirmed to exist
+        if current_folder != self._last_valid_folder:
+            if os.path.exists(current_folder):
+                self._last_valid_folder = current_folder
+            else:
+                current_folder = _HOME
+
         folder = filedialog.askdirectory(
             title="Select Default Start Folder",
             initialdir=current_folder
         )
-        
+
         if folder:
+            self._last_valid_folder = folder
             self.default_start_folder_var.set(folder)
 
-    def perform_search(self, query: str, case_sensitive: bool, whole_word: bool) -> List[Tuple[str, str]]:
-        return []  # No searchable content in settings tab
-
-    def highlight_all_matches(self, matches: List[Tuple[str, str]]) -> None:
-        pass
-
-    def highlight_match(self, match_data: Tuple[str, str], is_focused: bool = True) -> None:
-        pass
-
-    def center_match(self, match_data: Tuple[str, str]) -> None:
-        pass
+    def _queue_scroll(self, units: int) -> None:
+        """Accumulate wheel notches and scroll once per frame instead of once per notch."""
+        self._wheel_units += units
+        if self._wheel_job is None:
+            self._wheel_job = self.after(_WHEEL_FLUSH_MS, self._flush_scroll)
 
-    def clear_highlights(self) -> None:
-        pass
+    def _flush_scroll(self) -> None:
+        self._wheel_job = None
+        units, self._wheel_units = self._wheel_units, 0
+        if units:
+            self.canvas.yview_scroll(units, "units")
 
-    def clear(self) -> None:
-        pass  # Settings tab doesn't need clearing
+    def _apply_scroll_region(self) -> None:
+        self._scroll_region_job = None
+        self.update_scroll_region()
 
     def update_scroll_region(self) -> None:
         """Update the canvas scroll region to ensure proper scrolling."""
         if hasattr(self, 'canvas') and hasattr(self, 'inner_frame'):
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
\ No newline at end of file
+            # The inner frame is the canvas's only item, anchored at the origin, so its
+            # own size is the scroll region; no need for a bbox("all") walk
+            inner = self.inner_frame
+            self.canvas.configure(scrollregion=(0, 0, inner.winfo_width(), inner.winfo_height()))
\ No newline at end of file
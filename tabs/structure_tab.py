@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, List, Tuple
+import time
+from typing import Any, Collection, Dict, Generator, Iterable, List, Optional, Tuple, cast
 
 import tkinter as tk
 import ttkbootstrap as ttk
@@ -13,6 +14,13 @@ from exceptions import FileOperationError, UIError
 from path_utils import get_relative_path, normalize_path
 from widgets import Tooltip
 
+# Time budget for one slice of a progressive "Expand All", so the UI gets a
+# chance to repaint and handle input roughly once per frame.
+_EXPAND_SLICE_SECONDS = 0.016
+
+# Selection-state tags; a text-file row carries exactly one of them.
+_FILE_TAGS = ('file_selected', 'file_default', 'file_unloaded')
+
 
 class StructureTab(ttk.Frame):
     gui: Any
@@ -27,6 +35,11 @@ class StructureTab(ttk.Frame):
     filter_entry: ttk.Entry
     tree: ttk.Treeview
     filter_timer: Any
+    _norm_path_cache: Dict[str, str]
+    _label_cache: Dict[str, str]
+    _expand_walk: Optional[Generator[int, None, None]]
+    _expand_job: Optional[str]
+    _applied_tag_options: Dict[str, Dict[str, Any]]
 
     def __init__(
         self,
@@ -43,6 +56,11 @@ class StructureTab(ttk.Frame):
         self.show_unloaded_var = show_unloaded_var
         # Colors now managed by ttkbootstrap theme
         self.expand_collapse_var = ttk.BooleanVar(value=True)
+        self._norm_path_cache = {}
+        self._label_cache = {}
+        self._expand_walk = None
+        self._expand_job = None
+        self._applied_tag_options = {}
         self.setup_ui()
 
     def setup_ui(self) -> None:
@@ -77,20 +95,8 @@ class StructureTab(ttk.Frame):
         self.tree.heading("#0", text="Name", anchor='w')
         self.tree.heading("checkbox", text="Sel")
 
-        # Get theme colors from ttkbootstrap
-        style = ttk.Style()  # type: ignore[no-untyped-call]
-        colors = style.colors
-
-        unloaded_font: Any = ('TkDefaultFont', -1, 'overstrike') if self.gui.high_contrast_mode.get() else (None, -10, 'overstrike')
-        self.tree.tag_configure('folder', foreground=colors.info)
-        self.tree.tag_configure('file_selected', foreground=colors.success)
-        self.tree.tag_configure('file_unloaded', foreground=colors.secondary, font=unloaded_font)
-        self.tree.tag_configure('file_default', foreground=colors.fg)
-        self.tree.tag_configure('file_nontext', foreground=colors.fg)
-        self.tree.tag_configure('error', foreground=colors.danger)
-        self.tree.tag_configure('empty', foreground=colors.fg)
-        self.tree.tag_configure("highlight", background=colors.warning, foreground=colors.bg)
-        self.tree.tag_configure("focused_highlight", background=colors.primary, foreground=colors.bg)
+        # Tag colors come from the ttkbootstrap theme
+        self.update_tag_colors()
 
         tree_scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
         self.tree.configure(yscrollcommand=tree_scrollbar.set)
@@ -126,7 +132,10 @@ class StructureTab(ttk.Frame):
 
     def populate_tree(self, root_dir: str) -> None:
         logging.info(f"StructureTab: Populating tree with root: {root_dir}")
+        self._cancel_progressive_expand()
         self.tree.delete(*self.tree.get_children())
+        self._norm_path_cache.clear()
+        self.forget_items()
         if not root_dir or not os.path.exists(root_dir):
             logging.warning("populate_tree called with invalid root_dir")
             return
@@ -162,6 +171,11 @@ class StructureTab(ttk.Frame):
 
         self.update_expand_collapse_button()
 
+    def _item_tags(self, item_id: str) -> Tuple[str, ...]:
+        """A row's tags via the narrow item(id, 'tags') getter, normalized to a tuple."""
+        # splitlist is unannotated in the tkinter stubs
+        return cast(Tuple[str, ...], cast(Any, self.tree.tk).splitlist(self.tree.item(item_id, "tags")))
+
     def handle_tree_click(self, event: tk.Event[Any]) -> None:
         region = self.tree.identify_region(event.x, event.y)
         if region != "cell": return
@@ -182,7 +196,7 @@ class StructureTab(ttk.Frame):
         col = self.tree.identify_column(event.x)
 
         if col == "#0":
-            tags = self.tree.item(item_id)['tags']
+            tags = self._item_tags(item_id)
             if 'folder' in tags:
                  pass
             elif any(t in tags for t in ['file_selected', 'file_default', 'file_unloaded', 'file_nontext']):
@@ -190,21 +204,20 @@ class StructureTab(ttk.Frame):
 
     def handle_tree_open(self, event: tk.Event[Any]) -> None:
         item_id = self.tree.focus()
-        logging.debug(f"Tree open event for {item_id}")
-        if item_id and 'folder' in self.tree.item(item_id)['tags']:
+        logging.debug("Tree open event for %s", item_id)
+        if item_id and self.tree.tag_has('folder', item_id):
             self.file_handler.expand_folder(item_id)
 
     def jump_to_file_content(self, item_id: str) -> None:
         if self.gui.is_loading:
             self.gui.show_status_message("Loading in progress...", error=True); return
         try:
-             item_data = self.tree.item(item_id)
-             values = item_data['values']
-             tags = item_data['tags']
-             if not values or not tags: return
+             tags = self._item_tags(item_id)
+             if not tags: return
 
              if any(t in tags for t in ['file_selected', 'file_default', 'file_unloaded']):
-                 file_path = values[0]
+                 file_path = str(self.tree.set(item_id, 'path'))
+                 if not file_path: return
                  try:
                      rel_path = get_relative_path(file_path, self.gui.current_repo_path) or file_path
                  except ValueError:
@@ -236,18 +249,43 @@ class StructureTab(ttk.Frame):
         is_currently_expanded = self.expand_collapse_button.cget('text') == "Collapse All"
 
         if is_currently_expanded:
+            self._cancel_progressive_expand()
             self.gui.show_status_message("Collapsing folders...")
             self.file_handler.collapse_all()
             self.expand_collapse_button.config(text="Expand All")
             self.gui.show_status_message("Folders collapsed.")
         else:
-            self.gui.show_status_message("Expanding folders (may take time)...")
-            self.gui.root.config(cursor="watch")
-            self.gui.root.update_idletasks()
-            self.file_handler.expand_all()
-            self.gui.root.config(cursor="")
+            self.gui.show_status_message("Expanding folders...")
+            self.start_progressive_expand()
             self.expand_collapse_button.config(text="Collapse All")
-            self.gui.show_status_message("Folders expanded.")
+
+    def start_progressive_expand(self) -> None:
+        """Expand all folders by advancing FileHandler's expand walk in after_idle slices."""
+        self._cancel_progressive_expand()
+        self._expand_walk = self.file_handler.iter_expand_all()
+        self._expand_job = self.after_idle(self._expand_chunk)
+
+    def _cancel_progressive_expand(self) -> None:
+        if self._expand_job:
+            self.after_cancel(self._expand_job)
+            self._expand_job = None
+        if self._expand_walk is not None:
+            self._expand_walk.close()
+            self._expand_walk = None
+
+    def _expand_chunk(self) -> None:
+        """Advance the expand walk until the slice budget runs out, then reschedule."""
+        self._expand_job = None
+        walk = self._expand_walk
+        if walk is None:
+            return
+        deadline = time.perf_counter() + _EXPAND_SLICE_SECONDS
+        for _ in walk:
+            if time.perf_counter() >= deadline:
+                self._expand_job = self.after_idle(self._expand_chunk)
+                return
+        self._expand_walk = None
+        self.gui.show_status_message("Folders expanded.")
 
     def generate_folder_structure_text(self) -> str:
         root_items = self.tree.get_children("")
@@ -257,89 +295,92 @@ class StructureTab(ttk.Frame):
         logging.info("Generating folder structure text")
         include_icons = self.settings.get('app', 'include_icons', 1) == 1
 
-        structure_lines = []
-
-        def traverse(item_id: str, indent: str = "", prefix: str = "") -> None:
-            item_info = self.tree.item(item_id)
+        structure_lines: List[str] = []
+        item = self.tree.item
+        get_children = self.tree.get_children
+        # "Loading..." placeholders of unexpanded folders are never emitted; one
+        # tag_has call lets them be dropped before any per-node item() lookup.
+        dummies = set(self.tree.tag_has('dummy'))
+        # Explicit stack of (item_id, indent, prefix); children are pushed in reverse
+        # so they pop in display order. One item() call per node.
+        stack: List[Tuple[str, str, str]] = [(root_items[0], "", "")]
+        while stack:
+            item_id, indent, prefix = stack.pop()
+            item_info = item(item_id)
             item_text_raw = item_info["text"]
             item_tags = item_info["tags"]
-            item_values = item_info["values"]
 
-            if 'dummy' in item_tags or 'error' in item_tags or 'empty' in item_tags:
+            if 'error' in item_tags or 'empty' in item_tags:
                 if 'empty' in item_tags:
-                     display_text = "(empty)"
+                    display_text = "(empty)"
                 else:
-                    return
-
+                    continue
             elif not include_icons and len(item_text_raw) > 2 and item_text_raw[1] == ' ':
-                 display_text = item_text_raw[2:]
+                display_text = item_text_raw[2:]
             else:
-                 display_text = item_text_raw
-            
-            logging.debug(f"Traversing item: {item_id}, text: {display_text}")
+                display_text = item_text_raw
 
             structure_lines.append(f"{indent}{prefix}{display_text}")
 
-            children = self.tree.get_children(item_id)
-            if 'folder' in item_tags and children:
-                is_loaded = not (len(children) == 1 and 'dummy' in self.tree.item(children[0])['tags'])
-
-                if is_loaded:
-                    for i, child_id in enumerate(children):
-                        sub_prefix = "└── " if i == len(children) - 1 else "├── "
-                        sub_indent = indent + ("    " if i == len(children) - 1 else "│   ")
-                        traverse(child_id, sub_indent, sub_prefix)
-
-        if root_items:
-             traverse(root_items[0])
+            if 'folder' in item_tags:
+                children = get_children(item_id)
+                if dummies:
+                    children = tuple(c for c in children if c not in dummies)
+                if children:
+                    last = len(children) - 1
+                    mid_indent = indent + "│   "
+                    stack.append((children[last], indent + "    ", "└── "))
+                    stack.extend((child_id, mid_indent, "├── ") for child_id in reversed(children[:last]))
 
         return "\n".join(structure_lines)
 
-    def update_tree_strikethrough(self) -> None:
-        if not self.tree.get_children(): return
+    def _normalized(self, item_path: str) -> str:
+        """normalize_path memoized per tree; item paths never change once inserted."""
+        cached = self._norm_path_cache.get(item_path)
+        if cached is None:
+            cached = self._norm_path_cache[item_path] = normalize_path(item_path)
+        return cached
 
+    def update_tree_strikethrough(self) -> None:
+        # No emptiness pre-check: on an empty tree the tag_has sweep below finds nothing.
         show_unloaded = self.show_unloaded_var.get() == 1
         # NEW_LOG
-        logging.debug(f"Updating strikethrough, show_unloaded: {show_unloaded}")
+        logging.debug("Updating strikethrough, show_unloaded: %s", show_unloaded)
         with self.file_handler.lock:
-            loaded_files_copy = set(self.file_handler.loaded_files)
-
-        def update_item(item_id: str) -> None:
-            if not self.tree.exists(item_id): return
-
-            item_data = self.tree.item(item_id)
-            values = item_data["values"]
-            tags = list(item_data["tags"])
+            loaded_files_copy = frozenset(self.file_handler.loaded_files)
+
+        tree = self.tree
+        # Every text-file row carries exactly one of these tags, so three tag_has
+        # calls enumerate them without walking folders, dummies or non-text files.
+        candidates = set(tree.tag_has('file_selected'))
+        candidates.update(tree.tag_has('file_default'))
+        candidates.update(tree.tag_has('file_unloaded'))
+        unselected_tag = 'file_unloaded' if show_unloaded else 'file_default'
+
+        restrike = self._restrike_item
+        for item_id in candidates:
+            restrike(item_id, loaded_files_copy, unselected_tag)
+
+    def update_item_strikethrough(self, item_id: str) -> None:
+        """Re-tag a single file row after its selection changed, without sweeping the tree."""
+        if not self.tree.exists(item_id): return
+        unselected_tag = 'file_unloaded' if self.show_unloaded_var.get() == 1 else 'file_default'
+        with self.file_handler.lock:
+            self._restrike_item(item_id, self.file_handler.loaded_files, unselected_tag)
 
-            if 'folder' in tags or 'error' in tags or 'dummy' in tags or 'empty' in tags:
-                 pass
-            elif values and len(values) > 0:
-                 item_path = values[0]
-                 # FIX: Normalize path for comparison with the set
-                 item_path_norm = normalize_path(item_path)
-                 is_selected = item_path_norm in loaded_files_copy
-
-                 if 'file_selected' in tags: tags.remove('file_selected')
-                 if 'file_default' in tags: tags.remove('file_default')
-                 if 'file_unloaded' in tags: tags.remove('file_unloaded')
-
-                 if 'file_nontext' not in tags:
-                     if is_selected:
-                         tags.append('file_selected')
-                     elif show_unloaded:
-                         tags.append('file_unloaded')
-                     else:
-                         tags.append('file_default')
-                 
-                 # NEW_LOG
-                 logging.debug(f"Updated tags for {item_id}: {tags}")
-                 self.tree.item(item_id, tags=tuple(tags))
-
-            for child in self.tree.get_children(item_id):
-                update_item(child)
-
-        for root_item in self.tree.get_children(""):
-            update_item(root_item)
+    def _restrike_item(self, item_id: str, loaded_files: Collection[str], unselected_tag: str) -> None:
+        item_data = self.tree.item(item_id)
+        values = item_data["values"]
+        tags = list(item_data["tags"])
+        if not values or not any(t in tags for t in _FILE_TAGS):
+            return
+        # FIX: Normalize path for comparison with the set
+        desired = 'file_selected' if self._normalized(values[0]) in loaded_files else unselected_tag
+        if desired in tags and not any(t in tags for t in _FILE_TAGS if t != desired):
+            return  # already classified correctly; skip the write
+        tags = [t for t in tags if t not in _FILE_TAGS]
+        tags.append(desired)
+        self.tree.item(item_id, tags=tuple(tags))
 
     def update_expand_collapse_button(self) -> None:
         if not self.tree.get_children():
@@ -359,19 +400,26 @@ class StructureTab(ttk.Frame):
         from widgets.search_utils import label_matches_query
 
         matches: List[str] = []
-        if self.tree.get_children():
-             def collect_matches(item: str) -> None:
-                 item_text = self.tree.item(item)["text"]
-                 if label_matches_query(
-                     item_text,
-                     query,
-                     case_sensitive=bool(case_sensitive),
-                     whole_word=bool(whole_word),
-                 ):
-                     matches.append(item)
-                 for child in self.tree.get_children(item):
-                     collect_matches(child)
-             collect_matches(self.tree.get_children("")[0])
+        tree = self.tree
+        roots = tree.get_children("")
+        if not roots or not query:
+            return matches
+
+        # Only folders can have children, so get_children is skipped for every
+        # file row. A row's label never changes, so each is fetched from Tcl once;
+        # forget_items drops the cached labels whenever rows are deleted.
+        folders = set(tree.tag_has('folder'))
+        labels = self._label_cache
+        stack = [roots[0]]
+        while stack:
+            item_id = stack.pop()
+            label = labels.get(item_id)
+            if label is None:
+                label = labels[item_id] = str(tree.item(item_id, "text"))
+            if label_matches_query(label, query, case_sensitive=bool(case_sensitive), whole_word=bool(whole_word)):
+                matches.append(item_id)
+            if item_id in folders:
+                stack.extend(reversed(tree.get_children(item_id)))
         return matches
 
     def highlight_all_matches(self, matches: List[str]) -> None:
@@ -382,43 +430,78 @@ class StructureTab(ttk.Frame):
         highlight_tag = "focused_highlight" if is_focused else "highlight"
         other_highlight_tag = "highlight" if is_focused else "focused_highlight"
         item_id = match_data
-        tags = list(self.tree.item(item_id)["tags"])
+        tags = list(self._item_tags(item_id))
         if other_highlight_tag in tags: tags.remove(other_highlight_tag)
         if highlight_tag not in tags: tags.append(highlight_tag)
         self.tree.item(item_id, tags=tuple(tags))
 
     def center_match(self, match_data: str) -> None:
         item_id = match_data
-        self.tree.see(item_id)
+        # bbox is empty when the row is scrolled off-screen or under a closed
+        # folder; only then is see() needed to open ancestors and scroll.
+        if not self.tree.bbox(item_id):
+            self.tree.see(item_id)
         self.tree.selection_set(item_id)
 
     def clear_highlights(self) -> None:
-        if self.tree.get_children():
-             def clear_recursive(item: str) -> None:
-                 tags = list(self.tree.item(item)["tags"])
-                 updated = False
-                 if "highlight" in tags: tags.remove("highlight"); updated = True
-                 if "focused_highlight" in tags: tags.remove("focused_highlight"); updated = True
-                 if updated: self.tree.item(item, tags=tuple(tags))
-                 for child in self.tree.get_children(item):
-                     clear_recursive(child)
-             clear_recursive(self.tree.get_children("")[0])
+        # Only highlighted rows need touching; tag_has lists them directly.
+        tree = self.tree
+        for tag in ("highlight", "focused_highlight"):
+            for item_id in tree.tag_has(tag):
+                tags = [t for t in self._item_tags(item_id) if t != tag]
+                tree.item(item_id, tags=tuple(tags))
+
+    def forget_items(self, item_ids: Optional[Iterable[str]] = None) -> None:
+        """Drop cached labels for rows about to be deleted and all their descendants.
+
+        Call before tree.delete, while the subtrees can still be walked. With no ids,
+        drop every cached label.
+        """
+        labels = self._label_cache
+        if item_ids is None:
+            labels.clear()
+            return
+        tree = self.tree
+        stack = list(item_ids)
+        while stack:
+            item_id = stack.pop()
+            # perform_search caches a row only after its parent, so an uncached
+            # row has no cached descendants and its subtree can be skipped.
+            if labels.pop(item_id, None) is not None:
+                stack.extend(tree.get_children(item_id))
 
     def clear(self) -> None:
+        self._cancel_progressive_expand()
         self.tree.delete(*self.tree.get_children())
+        self._norm_path_cache.clear()
+        self.forget_items()
 
-    def update_tag_colors(self) -> None:
-        """Updates treeview tag colors to match the current theme."""
+    def _tag_options(self) -> Dict[str, Dict[str, Any]]:
+        """Treeview tag options for the current theme and contrast mode."""
         style = ttk.Style()  # type: ignore[no-untyped-call]
         colors = style.colors
 
         unloaded_font_attr: Any = ('TkDefaultFont', -1, 'overstrike') if self.gui.high_contrast_mode.get() else (None, -10, 'overstrike')
-        self.tree.tag_configure('folder', foreground=colors.info)
-        self.tree.tag_configure('file_selected', foreground=colors.success)
-        self.tree.tag_configure('file_unloaded', foreground=colors.secondary, font=unloaded_font_attr)
-        self.tree.tag_configure('file_default', foreground=colors.fg)
-        self.tree.tag_configure('file_nontext', foreground=colors.fg)
-        self.tree.tag_configure('error', foreground=colors.danger)
-        self.tree.tag_configure('empty', foreground=colors.fg)
-        self.tree.tag_configure("highlight", background=colors.warning, foreground=colors.bg)
-        self.tree.tag_configure("focused_highlight", background=colors.primary, foreground=colors.bg)
\ No newline at end of file
+        return {
+            'folder': {'foreground': colors.info},
+            'file_selected': {'foreground': colors.success},
+            'file_unloaded': {'foreground': colors.secondary, 'font': unloaded_font_attr},
+            'file_default': {'foreground': colors.fg},
+            'file_nontext': {'foreground': colors.fg},
+            'error': {'foreground': colors.danger},
+            'empty': {'foreground': colors.fg},
+            'highlight': {'background': colors.warning, 'foreground': colors.bg},
+            'focused_highlight': {'background': colors.primary, 'foreground': colors.bg},
+        }
+
+    def update_tag_colors(self) -> None:
+        """Updates treeview tag colors to match the current theme.
+
+        Only tags whose options differ from the last applied set are reconfigured,
+        since every tag_configure invalidates the tree's rows for redraw.
+        """
+        applied = self._applied_tag_options
+        for tag, options in self._tag_options().items():
+            if applied.get(tag) != options:
+                self.tree.tag_configure(tag, **options)
+                applied[tag] = options
@@ -1,6 +1,5 @@
 # tests/test_content_manager.py
 import os
-import tempfile
 import time
 import threading
 import logging
@@ -15,27 +14,18 @@ from logging_config import setup_logging
 setup_logging(level="INFO", console_output=False)
 
 @pytest.fixture
-def temp_repo():
+def temp_repo(tmp_path):
     """Fixture to create a temporary repository structure."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create sample files
-        file1_path = os.path.join(temp_dir, "file1.txt")
-        with open(file1_path, 'w', encoding='utf-8') as f:
-            f.write("Content of file1")
-
-        file2_path = os.path.join(temp_dir, "file2.py")
-        with open(file2_path, 'w', encoding='utf-8') as f:
-            f.write("print('Hello')")
-
-        # Create a binary file to test encoding error
-        binary_path = os.path.join(temp_dir, "binary.bin")
-        with open(binary_path, 'wb') as f:
-            f.write(b'\x00\xFF')
-
-        # Create a non-existent file path for testing
-        missing_path = os.path.join(temp_dir, "missing.txt")
-
-        yield temp_dir, file1_path, file2_path, binary_path, missing_path
+    # Create sample files
+    (tmp_path / "file1.txt").write_text("Content of file1", encoding='utf-8')
+    (tmp_path / "file2.py").write_text("print('Hello')", encoding='utf-8')
+    # Create a binary file to test encoding error
+    (tmp_path / "binary.bin").write_bytes(b'\x00\xFF')
+
+    temp_dir = str(tmp_path)
+    # missing.txt is deliberately never created
+    yield (temp_dir, os.path.join(temp_dir, "file1.txt"), os.path.join(temp_dir, "file2.py"),
+           os.path.join(temp_dir, "binary.bin"), os.path.join(temp_dir, "missing.txt"))
 
 def test_get_file_content_success(temp_repo):
     temp_dir, file1_path, _, _, _ = temp_repo
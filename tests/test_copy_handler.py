@@ -36,16 +36,31 @@ def copy_handler(mock_gui):
     return CopyHandler(mock_gui)
 
 
-def test_copy_contents_success(copy_handler, mock_gui):
-    with patch("handlers.copy_handler.start_content_generation") as mock_start:
-        copy_handler.copy_contents()
-        mock_gui.show_loading_state.assert_called_with("Preparing content for clipboard...")
-        mock_start.assert_called_once()
-        kwargs = mock_start.call_args.kwargs
-        assert kwargs["files"] == {"file1"}
-        assert kwargs["repo_path"] == "/repo"
-        assert kwargs["template_format"] == "Markdown (Grok)"
-        assert callable(kwargs["on_complete"])
+@pytest.fixture
+def mock_start():
+    with patch("handlers.copy_handler.start_content_generation") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_copy():
+    with patch('pyperclip.copy') as mock:
+        yield mock
+
+
+@pytest.mark.parametrize("method, loading_message", [
+    ("copy_contents", "Preparing content for clipboard..."),
+    ("copy_all", "Preparing combined content for clipboard..."),
+])
+def test_copy_success(copy_handler, mock_gui, mock_start, method, loading_message):
+    getattr(copy_handler, method)()
+    mock_gui.show_loading_state.assert_called_with(loading_message)
+    mock_start.assert_called_once()
+    kwargs = mock_start.call_args.kwargs
+    assert kwargs["files"] == {"file1"}
+    assert kwargs["repo_path"] == "/repo"
+    assert kwargs["template_format"] == "Markdown (Grok)"
+    assert callable(kwargs["on_complete"])
 
 
 def test_copy_contents_no_files(copy_handler, mock_gui):
@@ -61,11 +76,10 @@ def test_copy_contents_no_repo(copy_handler, mock_gui):
     mock_gui.show_status_message.assert_called_with("No repository loaded.", error=True)
 
 
-def test_copy_structure_success(copy_handler, mock_gui):
-    with patch('pyperclip.copy') as mock_copy:
-        copy_handler.copy_structure()
-        mock_copy.assert_called_with("Structure\n")
-        mock_gui.show_status_message.assert_called_with("Folder structure copied to clipboard.")
+def test_copy_structure_success(copy_handler, mock_gui, mock_copy):
+    copy_handler.copy_structure()
+    mock_copy.assert_called_with("Structure\n")
+    mock_gui.show_status_message.assert_called_with("Folder structure copied to clipboard.")
 
 
 def test_copy_structure_empty(copy_handler, mock_gui):
@@ -74,16 +88,6 @@ def test_copy_structure_empty(copy_handler, mock_gui):
     mock_gui.show_status_message.assert_called_with("Generated structure is empty.", error=True)
 
 
-def test_copy_all_success(copy_handler, mock_gui):
-    with patch("handlers.copy_handler.start_content_generation") as mock_start:
-        copy_handler.copy_all()
-        mock_start.assert_called_once()
-        kwargs = mock_start.call_args.kwargs
-        assert kwargs["files"] == {"file1"}
-        assert kwargs["repo_path"] == "/repo"
-        assert kwargs["template_format"] == "Markdown (Grok)"
-
-
 def test_copy_all_no_content(copy_handler, mock_gui):
     mock_gui.file_handler.loaded_files = set()
     mock_gui.structure_tab.tree.get_children.return_value = []
@@ -92,11 +96,10 @@ def test_copy_all_no_content(copy_handler, mock_gui):
     mock_gui.show_status_message.assert_called_with("Nothing to copy.", error=True)
 
 
-def test_handle_copy_completion_final_success(copy_handler, mock_gui):
-    with patch('pyperclip.copy') as mock_copy:
-        copy_handler._handle_copy_completion_final("Prompt", "Content\n", "Structure\n", [], "Copied")
-        mock_copy.assert_called_with("Prompt\n\n---\n\nContent\n\n---\n\nFolder Structure:\nStructure\n")
-        mock_gui.show_status_message.assert_called_with("Copied")
+def test_handle_copy_completion_final_success(copy_handler, mock_gui, mock_copy):
+    copy_handler._handle_copy_completion_final("Prompt", "Content\n", "Structure\n", [], "Copied")
+    mock_copy.assert_called_with("Prompt\n\n---\n\nContent\n\n---\n\nFolder Structure:\nStructure\n")
+    mock_gui.show_status_message.assert_called_with("Copied")
 
 
 def test_handle_copy_completion_final_errors(copy_handler, mock_gui):
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import os
-import tempfile
 import tkinter as tk
 import threading
 import pytest
@@ -38,26 +37,33 @@ def file_handler(mock_gui):
     return fh
 
 
-@pytest.fixture
-def temp_repo():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create directory structure
-        sub_dir = os.path.join(temp_dir, "sub")
-        os.mkdir(sub_dir)
+@pytest.fixture(scope="module")
+def temp_repo(tmp_path_factory):
+    # Read-only for every test, so the module builds it once
+    temp_dir = str(tmp_path_factory.mktemp("repo"))
+    # Create directory structure
+    sub_dir = os.path.join(temp_dir, "sub")
+    os.mkdir(sub_dir)
+
+    file1_path = os.path.join(temp_dir, "file1.txt")
+    with open(file1_path, 'w') as f:
+        f.write("Text")
 
-        file1_path = os.path.join(temp_dir, "file1.txt")
-        with open(file1_path, 'w') as f:
-            f.write("Text")
+    file2_path = os.path.join(sub_dir, "file2.py")
+    with open(file2_path, 'w') as f:
+        f.write("Code")
 
-        file2_path = os.path.join(sub_dir, "file2.py")
-        with open(file2_path, 'w') as f:
-            f.write("Code")
+    nontext_path = os.path.join(temp_dir, "image.png")
+    with open(nontext_path, 'wb') as f:
+        f.write(b'\x89PNG')
 
-        nontext_path = os.path.join(temp_dir, "image.png")
-        with open(nontext_path, 'wb') as f:
-            f.write(b'\x89PNG')
+    return temp_dir, sub_dir, file1_path, file2_path, nontext_path
 
-        yield temp_dir, sub_dir, file1_path, file2_path, nontext_path
+@pytest.fixture
+def stub_scanner(monkeypatch):
+    """Nothing is ignored; only .txt and .py count as text files."""
+    monkeypatch.setattr("file_handler.is_ignored_path", lambda *args, **kwargs: False)
+    monkeypatch.setattr("file_handler.is_text_file", lambda p, g: p.endswith((".txt", ".py")))
 
 def test_get_extension_groups():
     groups = FileHandler.get_extension_groups()
@@ -66,6 +72,14 @@ def test_get_extension_groups():
     assert ".py" in groups["Programming Languages"]
     assert len(groups["Other"]) >= 0  # May vary
 
+def test_get_sorted_extension_groups():
+    sorted_groups = FileHandler.get_sorted_extension_groups()
+    groups = FileHandler.get_extension_groups()
+    assert [group for group, _ in sorted_groups] == list(groups)
+    for group, extensions in sorted_groups:
+        assert extensions == tuple(sorted(groups[group]))
+    assert FileHandler.get_sorted_extension_groups() is sorted_groups
+
 def test_populate_tree(file_handler, temp_repo):
     temp_dir, *_ = temp_repo
     file_handler.repo_path = temp_dir
@@ -73,16 +87,12 @@ def test_populate_tree(file_handler, temp_repo):
     # Check that the tree's insert method was called, indicating population started
     file_handler.gui.tree.insert.assert_called()
 
-def test_build_tree_level(file_handler, temp_repo, monkeypatch):
+def test_build_tree_level(file_handler, temp_repo, stub_scanner):
     temp_dir, sub_dir, file1_path, file2_path, nontext_path = temp_repo
     file_handler.repo_path = temp_dir
     file_handler.ignore_patterns = []
     parent_id = "parent"
 
-    # Mock is_ignored_path and is_text_file
-    monkeypatch.setattr("file_handler.is_ignored_path", lambda *args, **kwargs: False)
-    monkeypatch.setattr("file_handler.is_text_file", lambda p, g: p.endswith(".txt") or p.endswith(".py"))
-
     file_handler.build_tree_level(temp_dir, parent_id, selected=True)
 
     # Check inserts
@@ -137,6 +147,21 @@ def test_toggle_selection_folder(file_handler):
     # Check that the preview update was triggered
     file_handler.gui.trigger_preview_update.assert_called_once()
 
+def test_toggle_selection_file_updates_only_that_row(file_handler):
+    event = MagicMock(x=10, y=10)
+    file_handler.gui.tree.identify_region.return_value = "cell"
+    file_handler.gui.tree.identify_column.return_value = "#2"
+    item_id = "file_item"
+    file_handler.gui.tree.identify_row.return_value = item_id
+
+    file_handler.gui.tree.item.return_value = {'values': ["path/a.txt", "☐"], 'tags': ('file_default',)}
+
+    file_handler.toggle_selection(event)
+
+    assert "path/a.txt" in file_handler.loaded_files
+    file_handler.gui.structure_tab.update_item_strikethrough.assert_called_once_with(item_id)
+    file_handler.gui.structure_tab.update_tree_strikethrough.assert_not_called()
+
 def test_generate_folder_structure_text(file_handler, temp_repo):
     temp_dir, sub_dir, file1_path, file2_path, _ = temp_repo
     file_handler.repo_path = temp_dir
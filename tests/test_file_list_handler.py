@@ -1,11 +1,11 @@
 # tests/test_file_list_handler.py
 import os
-import tempfile
 import threading
 import pytest
 from unittest.mock import patch, MagicMock
 from file_list_handler import generate_list_content
 from constants import FILE_SEPARATOR
+from lru_cache import ThreadSafeLRUCache
 
 
 @pytest.fixture
@@ -29,27 +29,42 @@ def mock_gui():
     return gui
 
 
-@pytest.fixture
-def temp_repo():
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file1_path = os.path.join(temp_dir, "file1.txt")
-        with open(file1_path, 'w', encoding='utf-8') as f:
-            f.write("Content of file1")
+@pytest.fixture(autouse=True)
+def sync_thread(monkeypatch):
+    """Run the content worker inline so tests never race a background thread."""
+    class InlineThread:
+        def __init__(self, target, name=None, daemon=None, args=(), kwargs=None):
+            self._target = target
+            self._args = args
+            self._kwargs = kwargs or {}
+
+        def start(self):
+            self._target(*self._args, **self._kwargs)
+
+    monkeypatch.setattr("handlers.content_worker.threading.Thread", InlineThread)
 
-        file2_path = os.path.join(temp_dir, "file2.py")
-        with open(file2_path, 'w', encoding='utf-8') as f:
-            f.write("print('Hello')")
 
-        missing_path = os.path.join(temp_dir, "missing.txt")
+@pytest.fixture(scope="module")
+def temp_repo(tmp_path_factory):
+    # Read-only for every test, so the module builds it once
+    temp_dir = str(tmp_path_factory.mktemp("repo"))
+    file1_path = os.path.join(temp_dir, "file1.txt")
+    with open(file1_path, 'w', encoding='utf-8') as f:
+        f.write("Content of file1")
 
-        yield temp_dir, file1_path, file2_path, missing_path
+    file2_path = os.path.join(temp_dir, "file2.py")
+    with open(file2_path, 'w', encoding='utf-8') as f:
+        f.write("print('Hello')")
+
+    missing_path = os.path.join(temp_dir, "missing.txt")
+
+    return temp_dir, file1_path, file2_path, missing_path
 
 
 def test_generate_list_content_success(temp_repo, mock_gui):
     temp_dir, file1_path, file2_path, _ = temp_repo
     files_to_copy = {file1_path, file2_path}
     lock = threading.Lock()
-    from lru_cache import ThreadSafeLRUCache
     content_cache = ThreadSafeLRUCache(100, 10)
 
     generated_contents = []
@@ -83,7 +98,6 @@ def test_generate_list_content_with_missing_file(temp_repo, mock_gui):
     temp_dir, _, _, missing_path = temp_repo
     files_to_copy = {missing_path}
     lock = threading.Lock()
-    from lru_cache import ThreadSafeLRUCache
     content_cache = ThreadSafeLRUCache(100, 10)
 
     generated_contents = []
@@ -108,15 +122,13 @@ def test_generate_list_content_with_missing_file(temp_repo, mock_gui):
 
 def test_generate_list_content_threading(mock_gui):
     with patch("file_list_handler.start_content_generation") as mock_start:
-        from lru_cache import ThreadSafeLRUCache
-
         generate_list_content(
             mock_gui,
             set(),
             "",
-            threading.Lock(),
+            MagicMock(),  # lock and cache are only passed through to the patched worker
             lambda *a: None,
-            ThreadSafeLRUCache(100, 10),
+            MagicMock(),
         )
 
         mock_start.assert_called_once()
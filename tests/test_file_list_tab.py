@@ -9,7 +9,7 @@ from tabs.file_list_tab import FileListTab
 def mock_gui():
     gui = MagicMock()
     gui.colors = {'bg': '#fff', 'fg': '#000', 'bg_accent': '#eee', 'btn_bg': '#ddd', 'btn_fg': '#000', 'status': '#f00', 'btn_hover': '#ccc'}
-    gui.create_button = MagicMock(side_effect=[MagicMock() for _ in range(3)])  # For load, copy, and clear buttons
+    gui.create_button = MagicMock(side_effect=lambda *a, **k: MagicMock())  # Fresh mock per button (load, copy, clear)
     gui.is_loading = False
     gui.current_repo_path = "/repo"
     gui.list_selected_files = set()
@@ -24,18 +24,24 @@ def mock_gui():
     gui.settings.security_enabled.return_value = False
     return gui
 
+@pytest.fixture(scope="module", autouse=True)
+def mock_scrolled_text_cls():
+    # Patched once for the module; file_list_tab resets it per test
+    with patch('tabs.file_list_tab.ScrolledText') as mock_cls:
+        yield mock_cls
+
 @pytest.fixture
-def file_list_tab(mock_gui):
+def file_list_tab(mock_gui, mock_scrolled_text_cls):
+    mock_scrolled_text_cls.reset_mock(return_value=True, side_effect=True)
     root = tk.Tk()
     root.withdraw()
     try:
         parent = tk.Frame(root)
         parent.pack()
-        with patch('tabs.file_list_tab.ScrolledText') as mock_scrolled_text_cls:
-            tab = FileListTab(parent, mock_gui)
-            tab.file_list_text = mock_scrolled_text_cls.return_value
-            tab.error_label = MagicMock()
-            yield tab
+        tab = FileListTab(parent, mock_gui)
+        tab.file_list_text = mock_scrolled_text_cls.return_value
+        tab.error_label = MagicMock()
+        yield tab
     finally:
         root.quit()
         root.destroy()
@@ -46,8 +52,7 @@ def test_setup_ui(mock_gui):
     try:
         parent = tk.Frame(root)
         parent.pack()
-        with patch('tabs.file_list_tab.ScrolledText'):
-            tab = FileListTab(parent, mock_gui)
+        tab = FileListTab(parent, mock_gui)
         assert tab.file_list_text is not None
         assert tab.load_list_button is not None
     finally:
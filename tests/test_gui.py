@@ -105,14 +105,16 @@ def gui(mock_root: tk.Tk) -> Generator[RepoPromptGUI, None, None]:
             gui_instance.base_prompt_tab.base_prompt_text.get = MagicMock(return_value="Prompt text\n")
 
             gui_instance.settings_tab = MagicMock()
-            gui_instance.settings_tab.default_tab_var = MagicMock(get=MagicMock(return_value="Content Preview"))
-            gui_instance.settings_tab.expansion_var = MagicMock(get=MagicMock(return_value="Collapsed"))
+            gui_instance.settings_tab.default_tab_menu = MagicMock(get=MagicMock(return_value="Content Preview"))
+            gui_instance.settings_tab.expansion_menu = MagicMock(get=MagicMock(return_value="Collapsed"))
             gui_instance.settings_tab.exclude_node_modules_var = MagicMock(get=MagicMock(return_value=1))
             gui_instance.settings_tab.exclude_dist_var = MagicMock(get=MagicMock(return_value=1))
             gui_instance.settings_tab.exclude_coverage_var = MagicMock(get=MagicMock(return_value=1))
             gui_instance.settings_tab.include_icons_var = MagicMock(get=MagicMock(return_value=1))
-            gui_instance.settings_tab.exclude_file_vars = {}
+            gui_instance.settings_tab.settings_tooltips_var = MagicMock(get=MagicMock(return_value=1))
+            gui_instance.settings_tab.get_exclude_selection = MagicMock(return_value={})
             gui_instance.settings_tab.extension_checkboxes = {}
+            gui_instance.settings_tab.get_extension_selection = MagicMock(return_value={})
             gui_instance.settings_tab.levels_entry = MagicMock(get=MagicMock(return_value="1"))
 
             gui_instance.file_list_tab = MagicMock()
@@ -309,28 +311,30 @@ def test_clear_all_confirm(gui: RepoPromptGUI) -> None:
         cast(MagicMock, mock_status).assert_called_with("All data cleared.")
 
 def test_save_app_settings(gui: RepoPromptGUI) -> None:
-    gui.settings_tab.default_tab_var = MagicMock(get=MagicMock(return_value="Content Preview"))
+    gui.settings_tab.default_tab_menu = MagicMock(get=MagicMock(return_value="Content Preview"))
     gui.prepend_var = MagicMock(get=MagicMock(return_value=1))
     gui.show_unloaded_var = MagicMock(get=MagicMock(return_value=0))
-    gui.settings_tab.expansion_var = MagicMock(get=MagicMock(return_value="Expanded"))
+    gui.settings_tab.expansion_menu = MagicMock(get=MagicMock(return_value="Expanded"))
     gui.settings_tab.levels_entry = MagicMock(get=MagicMock(return_value="2"))
     gui.settings_tab.exclude_node_modules_var = MagicMock(get=MagicMock(return_value=1))
     gui.settings_tab.exclude_dist_var = MagicMock(get=MagicMock(return_value=1))
-    gui.settings_tab.exclude_file_vars = {'file1': MagicMock(get=MagicMock(return_value=1))}
     gui.case_sensitive_var = MagicMock(get=MagicMock(return_value=0))
     gui.whole_word_var = MagicMock(get=MagicMock(return_value=0))
     gui.settings_tab.include_icons_var = MagicMock(get=MagicMock(return_value=1))
+    gui.settings_tab.settings_tooltips_var = MagicMock(get=MagicMock(return_value=0))
     gui.high_contrast_mode = MagicMock(get=MagicMock(return_value=0))
-    gui.settings_tab.extension_checkboxes = {'.txt': (MagicMock(), MagicMock(get=MagicMock(return_value=1)))}
 
     gui.current_repo_path = "/repo"
 
-    with patch.object(gui.settings, 'set') as mock_set, \
+    with patch.object(gui.settings_tab, 'get_exclude_selection', return_value={'file1': 1}), \
+         patch.object(gui.settings_tab, 'get_extension_selection', return_value={'.txt': 1}), \
+         patch.object(gui.settings, 'set') as mock_set, \
          patch.object(gui.settings, 'save'), \
          patch.object(gui, 'apply_default_tab'), \
          patch.object(gui.root, 'after'), \
          patch.object(gui, 'show_status_message') as mock_status:
         gui.save_app_settings()
+        cast(MagicMock, gui.settings_tab.ensure_ui).assert_called_once()
         mset = cast(MagicMock, mock_set)
         mset.assert_any_call('app', 'default_tab', "Content Preview")
         mset.assert_any_call('app', 'prepend_prompt', 1)
@@ -343,6 +347,7 @@ def test_save_app_settings(gui: RepoPromptGUI) -> None:
         mset.assert_any_call('app', 'search_case_sensitive', 0)
         mset.assert_any_call('app', 'search_whole_word', 0)
         mset.assert_any_call('app', 'include_icons', 1)
+        mset.assert_any_call('app', 'settings_tooltips', 0)
         mset.assert_any_call('app', 'high_contrast', 0)
         mset.assert_any_call('app', 'text_extensions', {'.txt': 1})
         cast(MagicMock, mock_status).assert_any_call("Settings saved successfully.")
@@ -402,14 +407,14 @@ def test_file_list_tab_init() -> None:
 def test_save_app_settings_invalid_levels(gui: RepoPromptGUI) -> None:
     # To prevent the 'save_app_settings' method from crashing on other missing
     # attributes, we provide minimal mocks for all the variables it tries to access.
-    gui.settings_tab.default_tab_var = MagicMock(get=MagicMock(return_value="Content Preview"))
-    gui.settings_tab.expansion_var = MagicMock(get=MagicMock(return_value="Collapsed"))
+    gui.settings_tab.default_tab_menu = MagicMock(get=MagicMock(return_value="Content Preview"))
+    gui.settings_tab.expansion_menu = MagicMock(get=MagicMock(return_value="Collapsed"))
     gui.settings_tab.exclude_node_modules_var = MagicMock(get=MagicMock(return_value=1))
     gui.settings_tab.exclude_dist_var = MagicMock(get=MagicMock(return_value=1))
-    gui.settings_tab.exclude_file_vars = {}
     gui.case_sensitive_var = MagicMock(get=MagicMock(return_value=0)) # The critical missing mock
     gui.whole_word_var = MagicMock(get=MagicMock(return_value=0))
     gui.settings_tab.include_icons_var = MagicMock(get=MagicMock(return_value=1))
+    gui.settings_tab.settings_tooltips_var = MagicMock(get=MagicMock(return_value=0))
     gui.high_contrast_mode = MagicMock(get=MagicMock(return_value=0))
     gui.settings_tab.extension_checkboxes = {}
 
@@ -417,7 +422,9 @@ def test_save_app_settings_invalid_levels(gui: RepoPromptGUI) -> None:
     gui.settings_tab.levels_entry = MagicMock(get=MagicMock(return_value="abc"))
 
     # Also patch messagebox to prevent popups during tests, even if an error occurs
-    with patch('tkinter.messagebox.showerror') as mock_showerror:
+    with patch('tkinter.messagebox.showerror') as mock_showerror, \
+         patch.object(gui.settings_tab, 'get_exclude_selection', return_value={}), \
+         patch.object(gui.settings_tab, 'get_extension_selection', return_value={}):
         gui.save_app_settings()
         # Assert the popup was NOT called, because our mock setup is now complete
         cast(MagicMock, mock_showerror).assert_not_called()
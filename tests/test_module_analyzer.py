@@ -3,6 +3,8 @@ from module_analyzer import _normalize_module_ref, _get_imports_from_source
 import os
 import tempfile
 
+import pytest
+
 
 def test_normalize_rust_module_ref():
     assert _normalize_module_ref("foo::bar::baz", "src") == "foo"
@@ -49,3 +51,19 @@ def test_typescript_import_extraction():
         assert "lodash" in refs
     finally:
         os.unlink(path)
+
+
+def test_build_dependency_graph_reports_progress(monkeypatch):
+    pytest.importorskip("networkx")
+    import module_analyzer
+    monkeypatch.setattr(module_analyzer, "PROGRESS_INTERVAL", 2)
+    monkeypatch.setattr(module_analyzer, "_get_imports_from_source", lambda _p: [])
+    module_to_files = {
+        "a": [("a/x.py", "/r/a/x.py"), ("a/y.py", "/r/a/y.py")],
+        "b": [("b/z.py", "/r/b/z.py")],
+    }
+    calls = []
+    module_analyzer.build_dependency_graph(
+        "/r", module_to_files, {}, progress_callback=lambda d, t: calls.append((d, t))
+    )
+    assert calls == [(2, 3), (3, 3)]
@@ -61,4 +61,13 @@ def test_clear_search_highlights(search_handler, mock_gui):
 def test_highlight_match(search_handler, mock_gui):
     mock_gui.match_positions[0] = [("1.0", "1.5")]
     search_handler._highlight_match(0, 0, is_focused=True)
-    mock_gui.content_tab.highlight_match.assert_called_with(("1.0", "1.5"), True)
\ No newline at end of file
+    mock_gui.content_tab.highlight_match.assert_called_with(("1.0", "1.5"), True)
+
+def test_search_skips_unsearchable_tab(search_handler, mock_gui):
+    mock_gui.notebook.index.return_value = 4
+    mock_gui.settings_tab.SEARCHABLE = False
+    search_handler.search_tab()
+    search_handler.find_all()
+    mock_gui.settings_tab.perform_search.assert_not_called()
+    mock_gui.settings_tab.clear_highlights.assert_not_called()
+    assert 4 not in mock_gui.match_positions
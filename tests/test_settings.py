@@ -57,4 +57,20 @@ def test_get_set(temp_settings_file):
     manager.settings_file = temp_settings_file
     assert manager.get('app', 'nonexistent', 42) == 42
     manager.set('app', 'test_key', "value")
-    assert manager.get('app', 'test_key') == "value"
\ No newline at end of file
+    assert manager.get('app', 'test_key') == "value"
+
+def test_get_many(temp_settings_file):
+    manager = SettingsManager()
+    manager.settings_file = temp_settings_file
+    manager.set('app', 'test_key', "value")
+    values = manager.get_many('app', {'test_key': None, 'nonexistent': 42})
+    assert values == {'test_key': "value", 'nonexistent': 42}
+
+def test_get_section(temp_settings_file):
+    manager = SettingsManager()
+    manager.settings_file = temp_settings_file
+    manager.set('app', 'test_key', "value")
+    section = manager.get_section('app')
+    assert section['test_key'] == "value"
+    assert section['include_icons'] == manager.get('app', 'include_icons')
+    assert manager.get_section('missing') == {}
@@ -3,7 +3,7 @@ import tkinter as tk
 from tkinter import ttk
 from unittest.mock import MagicMock, patch, ANY
 import pytest
-from widgets import Tooltip, FolderDialog
+from widgets import Tooltip, TooltipManager, FolderDialog
 
 @pytest.fixture
 def mock_root(make_ttk_root):
@@ -22,6 +22,35 @@ def test_tooltip_show_hide(mock_root):
     tooltip.hide_tip()  # Trigger leave
     assert tooltip.tip_window is None  # Hidden
 
+def test_tooltip_manager_shares_one_window(mock_root):
+    manager = TooltipManager(mock_root, delay=100)
+    first = tk.Button(mock_root, text="First")
+    second = tk.Button(mock_root, text="Second")
+    manager.register(first, "First tip")
+    manager.register(second, "Second tip")
+    assert first.bindtags()[0] == manager.tag
+    manager.schedule_show(MagicMock(widget=first))
+    manager.show_tip()
+    window = manager.tip_window
+    assert window is not None and manager.label is not None
+    assert manager.label.cget('text') == "First tip"
+    manager.hide_tip()
+    manager.schedule_show(MagicMock(widget=second))
+    manager.show_tip()
+    assert manager.tip_window is window  # Reused, not recreated
+    assert manager.label.cget('text') == "Second tip"
+
+def test_tooltip_manager_toggles_live(mock_root):
+    manager = TooltipManager(mock_root, delay=100, enabled=False)
+    button = tk.Button(mock_root, text="Tip")
+    manager.register(button, "Tip text")
+    manager.schedule_show(MagicMock(widget=button))
+    assert manager.id is None  # Disabled: nothing scheduled
+    manager.set_enabled(True)
+    manager.schedule_show(MagicMock(widget=button))
+    assert manager.id is not None
+    manager.hide_tip()
+
 def test_folder_dialog_recent_list(mock_root):
     recent = ["/folder1", "/folder2"]
     dialog = FolderDialog(mock_root, recent)
@@ -1,5 +1,5 @@
-# widgets package: Tooltip, FolderDialog, ToastManager
-from widgets.legacy import Tooltip, FolderDialog
+# widgets package: Tooltip, TooltipManager, FolderDialog, ToastManager
+from widgets.legacy import Tooltip, TooltipManager, FolderDialog
 from widgets.toast import ToastManager
 
-__all__ = ["Tooltip", "FolderDialog", "ToastManager"]
+__all__ = ["Tooltip", "TooltipManager", "FolderDialog", "ToastManager"]
@@ -1,9 +1,10 @@
-# widgets/legacy.py - Tooltip and FolderDialog (moved from root widgets.py for package layout)
+# widgets/legacy.py - Tooltip, TooltipManager and FolderDialog (moved from root widgets.py for package layout)
 from __future__ import annotations
 
+import itertools
 import os
 from tkinter import filedialog, messagebox
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, cast
 
 import tkinter as tk
 import ttkbootstrap as ttk
@@ -93,6 +94,112 @@ class Tooltip:
             self.tip_window = None
 
 
+class TooltipManager:
+    """ Shows tooltips for many widgets through one shared bind tag and one reused window.
+
+    Use instead of one Tooltip per widget when a view registers dozens of tips:
+    each registration only prepends the manager's bind tag and records the text.
+    Tips are still registered while disabled, so set_enabled can turn them on live.
+    """
+    _tag_ids = itertools.count()
+    master: tk.Misc
+    texts: Dict[str, str]
+    tooltip_bg: str
+    delay: int
+    enabled: bool
+    tag: str
+    tip_window: Optional[ttk.Toplevel]
+    label: Optional[tk.Label]
+    id: Optional[str]
+    x_offset: int
+    y_offset: int
+    _target: Optional[tk.Misc]
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        bg: str = '#2b2b2b',
+        delay: int = TOOLTIP_DELAY,
+        enabled: bool = True,
+    ) -> None:
+        self.master = master
+        self.texts = {}
+        self.tooltip_bg = bg
+        self.delay = delay
+        self.enabled = enabled
+        self.tag = f"TooltipManager{next(self._tag_ids)}"
+        self.tip_window = None
+        self.label = None
+        self.id = None
+        self.x_offset = 20
+        self.y_offset = 10
+        self._target = None
+
+        master.bind_class(self.tag, "<Enter>", self.schedule_show)
+        master.bind_class(self.tag, "<Leave>", self.hide_tip)
+        master.bind_class(self.tag, "<ButtonPress>", self.hide_tip)
+        master.bind_class(self.tag, "<FocusIn>", self.schedule_show)
+        master.bind_class(self.tag, "<FocusOut>", self.hide_tip)
+
+    def register(self, widget: tk.Misc, text: str) -> None:
+        """Show text when the pointer rests on widget (or it takes focus) while enabled."""
+        key = str(widget)
+        if key not in self.texts:
+            widget.bindtags((self.tag,) + widget.bindtags())
+        self.texts[key] = text
+
+    def set_enabled(self, enabled: bool) -> None:
+        """Turn every registered tip on or off, hiding one that is currently shown."""
+        self.enabled = enabled
+        if not enabled:
+            self.hide_tip()
+
+    def schedule_show(self, event: tk.Event[Any]) -> None:
+        self.hide_tip()
+        if not self.enabled:
+            return
+        self._target = event.widget
+        self.id = self.master.after(self.delay, self.show_tip)
+
+    def show_tip(self) -> None:
+        self.id = None
+        target = self._target
+        text = self.texts.get(str(target)) if target is not None else None
+        if target is None or not text:
+            return
+        if self.tip_window is None or self.label is None:
+            self.tip_window = tw = ttk.Toplevel(cast(Any, self.master))
+            tw.wm_overrideredirect(True)
+            tw.wm_attributes("-topmost", True)
+            self.label = tk.Label(tw, justify='left',
+                                  background=self.tooltip_bg,
+                                  foreground="#ffffff",
+                                  relief="solid", borderwidth=1,
+                                  wraplength=TOOLTIP_WRAP_LENGTH)
+            self.label.pack(ipadx=5, ipady=3)
+        tw = self.tip_window
+        self.label.configure(text=text)
+        tw.update_idletasks()
+        x, y = target.winfo_pointerxy()
+        x += self.x_offset
+        y += self.y_offset
+        tip_width = tw.winfo_reqwidth()
+        tip_height = tw.winfo_reqheight()
+        if x + tip_width > tw.winfo_screenwidth():
+            x = tw.winfo_screenwidth() - tip_width - self.x_offset
+        if y + tip_height > tw.winfo_screenheight():
+            y = target.winfo_rooty() - tip_height - 5
+        tw.wm_geometry(f"+{x}+{y}")
+        tw.deiconify()
+
+    def hide_tip(self, event: Optional[tk.Event[Any]] = None) -> None:
+        if self.id:
+            self.master.after_cancel(self.id)
+            self.id = None
+        if self.tip_window:
+            self.tip_window.withdraw()
+
+
 class FolderDialog:
     """ Custom dialog for selecting folders, showing recent folders with a delete option. """
     parent: tk.Misc